@@ -0,0 +1,65 @@
+"""Compare curry against the implementation it replaced.
+
+Run with ``python -m benchmarks.currying``. Each case calls a curried 5-ary
+function one argument at a time.
+"""
+
+import inspect
+import statistics
+import timeit
+from functools import update_wrapper
+from typing import Any, Callable, Tuple
+
+from monads.currying import (
+    CurriedBinary,
+    CurriedQuaternary,
+    CurriedQuinary,
+    CurriedTernary,
+    CurriedUnary,
+    curry,
+)
+
+NUMBER = 10**4
+
+
+def rebuilding_curry(f: Callable) -> Any:
+    """curry as it was, rebuilding the wrapper metadata on every application."""
+    signature = inspect.signature(f)
+    parameters = list(signature.parameters.values())
+
+    def wrapped(args: list, remaining: int) -> Any:
+        if remaining == 1:
+            curried = update_wrapper(lambda x: f(*(args + [x])), f)
+            curried.__signature__ = signature.replace(  # type: ignore
+                parameters=parameters[-remaining:]
+            )
+            return CurriedUnary(curried)
+        else:
+            curried = update_wrapper(lambda x: wrapped(args + [x], remaining - 1), f)
+            curried.__signature__ = signature.replace(  # type: ignore
+                parameters=parameters[-remaining:]
+            )
+            classes = [CurriedBinary, CurriedTernary, CurriedQuaternary, CurriedQuinary]
+            return classes[remaining - 2](curried)
+
+    return wrapped([], f.__code__.co_argcount)
+
+
+def add5(a: int, b: int, c: int, d: int, e: int) -> int:
+    return a + b + c + d + e
+
+
+def bench(run: Callable[[], Any]) -> Tuple[float, float]:
+    timings = [t / NUMBER for t in timeit.repeat(run, number=NUMBER, repeat=7)]
+    return statistics.mean(timings), statistics.stdev(timings)
+
+
+def main() -> None:
+    for label, implementation in [("rebuilding", rebuilding_curry), ("curry", curry)]:
+        curried = implementation(add5)
+        mean, stdev = bench(lambda: curried(1)(2)(3)(4)(5))
+        print(f"{label:10} {mean * 1e6:7.2f}us +- {stdev * 1e6:.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Time long Result pipelines that fail at their first stage.
+
+Run with ``python -m benchmarks.errors [stages]``. Each stage binds and maps
+over the failed result, so the time reported is dominated by how cheaply an
+Err is passed along.
+"""
+
+import sys
+import timeit
+from typing import Any, Callable
+
+from monads import Err, Ok, Result
+
+STAGES = 20
+
+
+def increment(x: int) -> Result[int, str]:
+    return Ok(x + 1)
+
+
+def pipeline(stages: int) -> Callable[[], Any]:
+    def run() -> Any:
+        m: Result[int, str] = Err("oops")
+        for _ in range(stages):
+            m = m.bind(increment).map(lambda x: x * 2)
+        return m
+
+    return run
+
+
+def main(stages: int) -> None:
+    run = pipeline(stages)
+    seconds = min(timeit.repeat(run, number=10**4, repeat=5)) / 10**4
+    print(f"{stages} failing stages: {seconds * 1e6:.2f}us per pipeline")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else STAGES)
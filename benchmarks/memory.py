@@ -0,0 +1,62 @@
+"""Measure the memory held by monad instances.
+
+Run with ``python -m benchmarks.memory``. Reports the bytes allocated per
+instance, including the instance's attribute storage but not the wrapped
+values themselves. The "unslotted" column uses classes storing the same
+attributes in an instance __dict__, as every monad did before they
+declared __slots__.
+"""
+
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, Tuple
+
+from monads import Err, Just, List, Nothing, Ok
+from monads.monoid import Addition, String
+
+N = 10**5
+
+
+class Unslotted:
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+class UnslottedEmpty:
+    pass
+
+
+# Each monad, and an unslotted class holding the same attributes.
+CASES: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "Just": (Just, Unslotted),
+    "Nothing": (lambda _: Nothing(), lambda _: UnslottedEmpty()),
+    "Ok": (Ok, Unslotted),
+    "Err": (Err, Unslotted),
+    "List": (List, Unslotted),
+    "String": (String, Unslotted),
+    "Addition": (Addition, Unslotted),
+}
+
+
+def measure(constructor: Callable[[Any], Any], n: int) -> float:
+    value = ["shared"]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [constructor(value) for _ in range(n)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    # Discount the list holding the instances.
+    return (after - before - sys.getsizeof([None] * n)) / n
+
+
+def main(n: int) -> None:
+    print(f"{'':16} {'slotted':>16} {'unslotted':>16}")
+    for name, (constructor, reference) in CASES.items():
+        slotted = measure(constructor, n)
+        unslotted = measure(reference, n)
+        print(f"{name:16} {slotted:16.1f} {unslotted:16.1f}  bytes/instance")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else N)
@@ -0,0 +1,52 @@
+"""Time running deeply composed Readers.
+
+Run with ``python -m benchmarks.reader``. The "nested" rows compose plain
+functions the way Reader.map used to, wrapping the previous function in a
+new lambda at every step; they fail once the depth exceeds the recursion
+limit. The time per step for Reader should stay flat as the depth grows.
+"""
+
+import sys
+import timeit
+from typing import Any, Callable, List
+
+from monads import Reader
+
+DEPTHS = [10**2, 10**3, 10**4, 10**5]
+
+
+def increment(x: int) -> int:
+    return x + 1
+
+
+def nested(depth: int) -> Callable[[Any], Any]:
+    f: Callable[[Any], Any] = lambda x: x
+    for _ in range(depth):
+        f = (lambda g: lambda x: increment(g(x)))(f)
+    return f
+
+
+def reader(depth: int) -> Callable[[Any], Any]:
+    m: Reader[int, int] = Reader(lambda x: x)
+    for _ in range(depth):
+        m = m.map(increment)
+    return m
+
+
+def main(depths: List[int]) -> None:
+    for label, build in [("nested", nested), ("Reader", reader)]:
+        for depth in depths:
+            run = build(depth)
+            try:
+                seconds = min(timeit.repeat(lambda: run(0), number=10, repeat=3)) / 10
+            except RecursionError:
+                print(f"{label:7} depth={depth:<7} RecursionError")
+                continue
+            print(
+                f"{label:7} depth={depth:<7} {seconds * 1e3:8.3f}ms "
+                f"{seconds / depth * 1e9:6.1f}ns/step"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEPTHS)
@@ -0,0 +1,60 @@
+"""Time ``sequence`` over growing inputs.
+
+Run with ``python -m benchmarks.sequence``. The time per element should stay
+roughly flat as the input grows; a quadratic implementation shows it growing
+with the input size instead.
+"""
+
+import asyncio
+import sys
+import timeit
+from typing import Any, Callable, Dict, List as _List
+
+from monads import Future, List, Maybe, Reader, Result
+
+SIZES = [10**3, 10**5, 10**6]
+
+
+def future(n: int) -> Callable[[], Any]:
+    def run() -> Any:
+        return asyncio.run(_await(Future.sequence(Future.pure(x) for x in range(n))))
+
+    return run
+
+
+async def _await(future: Future) -> Any:
+    return await future
+
+
+def reader(n: int) -> Callable[[], Any]:
+    constant: Reader = Reader.pure(0)
+    xs = [constant] * n
+    return lambda: Reader.sequence(xs)(None)
+
+
+def pure(cls: Any) -> Callable[[int], Callable[[], Any]]:
+    def setup(n: int) -> Callable[[], Any]:
+        xs: _List[Any] = [cls.pure(x) for x in range(n)]
+        return lambda: cls.sequence(xs)
+
+    return setup
+
+
+CASES: Dict[str, Callable[[int], Callable[[], Any]]] = {
+    "Maybe": pure(Maybe),
+    "Result": pure(Result),
+    "List": pure(List),
+    "Reader": reader,
+    "Future": future,
+}
+
+
+def main(sizes: _List[int]) -> None:
+    for name, setup in CASES.items():
+        for n in sizes:
+            seconds = min(timeit.repeat(setup(n), number=1, repeat=3))
+            print(f"{name:8} n={n:<8} {seconds:9.4f}s {seconds / n * 1e9:8.1f}ns/item")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
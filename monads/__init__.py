@@ -1,8 +1,11 @@
-from .functor import Functor
+from .functor import Functor, Fused
 from .applicative import Applicative
 from .monad import Monad
 from .list import List
+from .lazylist import LazyList
 from .maybe import Maybe, Just, Nothing
 from .result import Result, Ok, Err
 from .future import Future
+from .futureresult import FutureResult
 from .reader import Reader
+from .readerfuture import ReaderFuture
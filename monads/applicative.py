@@ -8,6 +8,8 @@ S = TypeVar("S")
 
 
 class Applicative(Functor[T]):
+    __slots__ = ()
+
     @classmethod
     def pure(cls, value: T) -> Applicative[T]:  # pragma: no cover
         raise NotImplementedError
@@ -1,6 +1,16 @@
-from functools import reduce, update_wrapper
+from functools import WRAPPER_ASSIGNMENTS, reduce, update_wrapper
 import inspect
-from typing import Callable, Generic, NewType, TypeVar, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    NewType,
+    Optional,
+    Type,
+    TypeVar,
+    overload,
+)
 
 from .reader import Reader
 
@@ -14,15 +24,41 @@ Result = TypeVar("Result")
 
 
 class Curried(Reader[A, Result]):
+    def __init__(
+        self, function: Callable[[A], Result], attributes: Optional[dict] = None
+    ) -> None:
+        if attributes is None:
+            super().__init__(function)
+        else:
+            # Metadata precomputed by curry, copied in a single update.
+            self.__dict__.update(attributes)
+            self._source = function
+            self._steps = None
+            self._plan = None
+
+    def __call__(self, *args, **kwargs):
+        return self._apply(args, kwargs)
+
+    def _apply(self, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        function = self._source
+        if isinstance(function, _Partial):
+            # Call the original function directly once all of its
+            # arguments are available.
+            if function.kwargs:
+                kwargs = dict(function.kwargs, **kwargs)
+            return function.curry.apply(function.args + args, kwargs)
+        return reduce(lambda f, x: f(x), args, function)
+
     def __repr__(self):  # pragma: no cover
-        module = self.function.__module__
-        name = getattr(self.function, "__name__", repr(self.function))
+        module = self.__module__
+        name = getattr(self, "__name__", repr(self.function))
         signature = inspect.signature(self)
         return f"<Curried {module}.{name}{signature}>"
 
 
 class CurriedUnary(Curried[A, Result]):
-    ...
+    def __call__(self, environment: A, **kwargs: Any) -> Result:
+        return self._apply((environment,), kwargs)
 
 
 class CurriedBinary(Curried[A, CurriedUnary[B, Result]]):
@@ -34,8 +70,8 @@ class CurriedBinary(Curried[A, CurriedUnary[B, Result]]):
     def __call__(self, environment: A, b: B) -> Result:
         ...
 
-    def __call__(self, *args):
-        return reduce(lambda f, x: f(x), args, self.function)
+    def __call__(self, *args, **kwargs):
+        return self._apply(args, kwargs)
 
 
 class CurriedTernary(Curried[A, CurriedBinary[B, C, Result]]):
@@ -51,8 +87,8 @@ class CurriedTernary(Curried[A, CurriedBinary[B, C, Result]]):
     def __call__(self, environment: A, b: B, c: C) -> Result:
         ...
 
-    def __call__(self, *args):
-        return reduce(lambda f, x: f(x), args, self.function)
+    def __call__(self, *args, **kwargs):
+        return self._apply(args, kwargs)
 
 
 class CurriedQuaternary(Curried[A, CurriedTernary[B, C, D, Result]]):
@@ -72,8 +108,8 @@ class CurriedQuaternary(Curried[A, CurriedTernary[B, C, D, Result]]):
     def __call__(self, environment: A, b: B, c: C, d: D) -> Result:
         ...
 
-    def __call__(self, *args):
-        return reduce(lambda f, x: f(x), args, self.function)
+    def __call__(self, *args, **kwargs):
+        return self._apply(args, kwargs)
 
 
 class CurriedQuinary(Curried[A, CurriedQuaternary[B, C, D, E, Result]]):
@@ -97,8 +133,101 @@ class CurriedQuinary(Curried[A, CurriedQuaternary[B, C, D, E, Result]]):
     def __call__(self, environment: A, b: B, c: C, d: D, e: E) -> Result:
         ...
 
-    def __call__(self, *args):
-        return reduce(lambda f, x: f(x), args, self.function)
+    def __call__(self, *args, **kwargs):
+        return self._apply(args, kwargs)
+
+
+class _Curry:
+    """Everything needed to curry a function, computed once per function.
+
+    Partially applied arguments are kept in a tuple, and the attributes
+    each Curried wrapper copies from the function (including its
+    signature with the applied parameters dropped) are prepared up front
+    for every number of remaining arguments.
+    """
+
+    def __init__(self, function: Callable, arity: Optional[int]) -> None:
+        try:
+            signature: Optional[inspect.Signature] = inspect.signature(function)
+        except (TypeError, ValueError):
+            signature = None
+        positional = []
+        keywords = []
+        if signature is not None:
+            for parameter in signature.parameters.values():
+                if parameter.kind in _POSITIONAL:
+                    positional.append(parameter)
+                elif parameter.kind is not parameter.VAR_POSITIONAL:
+                    keywords.append(parameter)
+        if arity is None:
+            if signature is None:
+                raise ValueError(
+                    f"Cannot determine the arity of {function!r}, pass it explicitly"
+                )
+            arity = len(positional)
+        if arity < 1:
+            raise ValueError("Function must take one or more positional arguments")
+
+        self.function = function
+        self.arity = arity
+        attributes: Dict[str, Any] = {
+            name: getattr(function, name)
+            for name in WRAPPER_ASSIGNMENTS
+            if hasattr(function, name)
+        }
+        attributes.update(getattr(function, "__dict__", {}))
+        attributes["__wrapped__"] = function
+        self.attributes = [dict(attributes) for _ in range(arity + 1)]
+        if signature is not None and arity <= len(positional):
+            for remaining in range(arity + 1):
+                parameters = positional[arity - remaining : arity] + keywords
+                self.attributes[remaining]["__signature__"] = signature.replace(
+                    parameters=parameters
+                )
+
+    def apply(self, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        arity = self.arity
+        if len(args) == arity:
+            return self.function(*args, **kwargs)
+        if len(args) < arity:
+            return self.curried(args, kwargs)
+        # Arguments beyond the arity are applied to the result in turn.
+        return reduce(
+            lambda f, x: f(x), args[arity:], self.function(*args[:arity], **kwargs)
+        )
+
+    def curried(self, args: tuple, kwargs: Dict[str, Any]) -> Curried:
+        remaining = self.arity - len(args)
+        cls = _curried_classes.get(remaining, Curried)
+        return cls(_Partial(self, args, kwargs), self.attributes[remaining])
+
+
+class _Partial:
+    """Applies one more argument to a partially applied function."""
+
+    __slots__ = ("curry", "args", "kwargs")
+
+    def __init__(self, curry: _Curry, args: tuple, kwargs: Dict[str, Any]) -> None:
+        self.curry = curry
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self, x: Any) -> Any:
+        return self.curry.apply(self.args + (x,), self.kwargs)
+
+
+_POSITIONAL = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+_curried_classes: Dict[int, Type[Curried]] = {
+    1: CurriedUnary,
+    2: CurriedBinary,
+    3: CurriedTernary,
+    4: CurriedQuaternary,
+    5: CurriedQuinary,
+}
 
 
 @overload
@@ -128,36 +257,27 @@ def curry(
     ...
 
 
-def curry(f):
-    signature = inspect.signature(f)
-    parameters = list(signature.parameters.values())
+@overload
+def curry(f: Callable[..., Result], arity: int) -> Curried[Any, Any]:
+    ...
 
-    def wrapped(args, remaining):
-        if remaining < 1:
-            raise ValueError("Function must take one or more positional arguments")
-        elif remaining == 1:
-            curried = update_wrapper(lambda x: f(*(args + [x])), f)
-            curried.__signature__ = signature.replace(
-                parameters=parameters[-remaining:]
-            )
-            return CurriedUnary(curried)
-        else:
-            curried = update_wrapper(lambda x: wrapped(args + [x], remaining - 1), f)
-            curried.__signature__ = signature.replace(
-                parameters=parameters[-remaining:]
-            )
-            if remaining == 2:
-                return CurriedBinary(curried)
-            elif remaining == 3:
-                return CurriedTernary(curried)
-            elif remaining == 4:
-                return CurriedQuaternary(curried)
-            elif remaining == 5:
-                return CurriedQuinary(curried)
-            else:
-                raise ValueError("Cannot curry a function with more than 5 arguments")
-
-    return wrapped([], f.__code__.co_argcount)
+
+@overload
+def curry(f: Callable[..., Any]) -> Curried[Any, Any]:
+    ...
+
+
+def curry(f, arity=None):
+    """Curry a function over its positional arguments.
+
+    Accepts any callable, including builtins, functools.partial objects
+    and bound methods. The arity is read from the callable's signature,
+    counting its positional parameters; pass it explicitly for callables
+    that have no signature or take variable positional arguments.
+    Keyword arguments may be given at any application and are passed on
+    when the function is finally called.
+    """
+    return _Curry(f, arity).curried((), {})
 
 
 @overload
@@ -188,7 +308,15 @@ def uncurry(
 
 
 def uncurry(f):
-    def wrapped(*args):
-        return reduce(lambda _f, x: _f(x), args, f)
+    function = getattr(f, "function", None)
+    if isinstance(function, _Partial):
+        # Curried functions take any number of arguments at once.
+        def wrapped(*args):
+            return f(*args)
+
+    else:
+
+        def wrapped(*args):
+            return reduce(lambda _f, x: _f(x), args, f)
 
     return update_wrapper(wrapped, f)
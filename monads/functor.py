@@ -1,12 +1,82 @@
 from __future__ import annotations
-from typing import Any, Callable, Generic, TypeVar
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
 
 T = TypeVar("T")
 S = TypeVar("S")
 
 
 class Functor(Generic[T]):
+    __slots__ = ()
+
     def map(self, function: Callable[[T], S]) -> Functor[S]:  # pragma: no cover
         raise NotImplementedError
 
+    def fused(self) -> Fused[T]:
+        """Collect subsequent map calls to apply them in a single pass."""
+        return Fused(self)
+
     __mul__ = __rmul__ = map
+
+
+class Fused(Functor[T]):
+    """Collects consecutive map calls on a functor.
+
+    Calling run maps the composition of every collected function over the
+    functor at once, so no intermediate functors are built.
+
+    e.g.:
+        List([1, 2, 3]).fused().map(f).map(g).map(h).run()
+
+    """
+
+    __slots__ = ("functor", "functions")
+
+    def __init__(
+        self, functor: Functor[Any], functions: Tuple[Callable[[Any], Any], ...] = ()
+    ) -> None:
+        self.functor = functor
+        self.functions = functions
+
+    def map(self, function: Callable[[T], S]) -> Fused[S]:
+        return Fused(self.functor, self.functions + (function,))
+
+    def run(self) -> Functor[T]:
+        if not self.functions:
+            return self.functor
+        return self.functor.map(compose(self.functions))
+
+    __mul__ = __rmul__ = map
+
+
+# The steps of a chain of calls, such as map and bind, kept as a linked list
+# of (step, previous) pairs, newest first, so that extending a chain does
+# not copy it.
+Steps = Optional[Tuple[T, Any]]
+
+
+def push(steps: Steps[T], step: T) -> Steps[T]:
+    """Add a step to the end of a chain."""
+    return (step, steps)
+
+
+def unwind(steps: Steps[T]) -> List[T]:
+    """List the steps of a chain, from first to last."""
+    flat: List[T] = []
+    while steps is not None:
+        step, steps = steps
+        flat.append(step)
+    flat.reverse()
+    return flat
+
+
+def compose(functions: Sequence[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Compose functions, applying them from first to last."""
+    if len(functions) == 1:
+        return functions[0]
+
+    def composed(x: Any) -> Any:
+        for function in functions:
+            x = function(x)
+        return x
+
+    return composed
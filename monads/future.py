@@ -1,20 +1,63 @@
 from __future__ import annotations
-import functools
-from typing import Awaitable, Callable, Iterable, List, TypeVar, Union
+import asyncio
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from .functor import Steps, push, unwind
 from .monad import Monad
+from .result import Err, Ok, Result
 
 T = TypeVar("T")
 S = TypeVar("S")
+U = TypeVar("U")
+
+
+# A step in a chain of map and bind calls: whether the function's result
+# must be awaited (bind) or not (map), and the function itself.
+Step = Tuple[bool, Callable[[Any], Any]]
+
+# The event loop time by which Futures awaited in the current context must
+# complete, if any. See deadline.
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
 
 
 class Future(Monad[T]):
     """Wraps an Awaitable in a Monad.
 
     The resulting Future object is, itself, Awaitable.
+
+    Calls to map and bind are collected as a chain of steps rather than
+    nested coroutines, and run in a single loop when the Future is
+    awaited. Long chains therefore run in constant stack depth.
     """
 
+    __slots__ = ("_awaitable", "_steps")
+
     def __init__(self, awaitable: Awaitable[T]) -> None:
-        self.awaitable = awaitable
+        self._awaitable: Awaitable[Any] = awaitable
+        self._steps: Steps[Step] = None
+
+    @property
+    def awaitable(self) -> Awaitable[T]:
+        if self._steps is None and _deadline.get() is None:
+            return self._awaitable
+        return self._run()
 
     @classmethod
     def pure(cls, value: T) -> Future[T]:
@@ -24,38 +67,190 @@ class Future(Monad[T]):
         return Future(identity(value))
 
     def map(self, function: Callable[[T], S]) -> Future[S]:
-        async def map(f: Callable[[T], S], x: Awaitable[T]) -> S:
-            x_ = await x
-            return f(x_)
-
-        return Future(map(function, self.awaitable))
+        return self._chain((False, function))
 
     def apply(self, functor: Awaitable[Callable[[T], S]]) -> Future[S]:
+        """Apply the function, awaiting it and this Future concurrently."""
+
         async def apply(f: Awaitable[Callable[[T], S]], x: Awaitable[T]) -> S:
-            f_ = await f
-            x_ = await x
+            f_, x_ = await _gather([f, x])
             return f_(x_)
 
         return Future(apply(functor, self.awaitable))
 
+    @classmethod
+    def map2(
+        cls, function: Callable[[T, U], S], a: Awaitable[T], b: Awaitable[U]
+    ) -> Future[S]:
+        """Apply a function to the results of two actions, run concurrently."""
+        return cls.mapN(function, a, b)
+
+    @classmethod
+    def mapN(cls, function: Callable[..., S], *xs: Awaitable[Any]) -> Future[S]:
+        """Apply a function to the results of any actions, run concurrently."""
+
+        async def mapN(awaitables: Tuple[Awaitable[Any], ...]) -> S:
+            return function(*await _gather(awaitables))
+
+        return Future(mapN(xs))
+
     def bind(self, function: Callable[[T], Awaitable[S]]) -> Future[S]:
-        async def bind(f: Callable[[T], Awaitable[S]], x: Awaitable[T]) -> S:
-            x_ = await x
-            y = await function(x_)
-            return y
+        return self._chain((True, function))
+
+    def map_in_executor(
+        self, function: Callable[[T], S], executor: Optional[Executor] = None
+    ) -> Future[S]:
+        """Map a function run in an executor rather than on the event loop.
+
+        Uses the loop's default executor if none is given. With a process
+        pool, the function and values must be picklable.
+        """
+        return self.bind(lambda x: Future.from_blocking(function, x, executor=executor))
+
+    @classmethod
+    def from_blocking(
+        cls,
+        function: Callable[..., T],
+        *args: Any,
+        executor: Optional[Executor] = None,
+    ) -> Future[T]:
+        """Call a blocking function in an executor.
+
+        Uses the loop's default executor if none is given.
+        """
+
+        async def from_blocking() -> T:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, function, *args)
+
+        return Future(from_blocking())
+
+    def shared(self) -> Future[T]:
+        """Make a Future that may be awaited any number of times.
 
-        return Future(bind(function, self.awaitable))
+        The work is scheduled as a task when first awaited, and its result
+        or error is kept for every later await. A consumer being cancelled
+        does not cancel the shared work.
+        """
+        return Future(_Shared(self))
+
+    def with_timeout(
+        self, seconds: Optional[float]
+    ) -> Future[Result[T, asyncio.TimeoutError]]:
+        """Wait at most a number of seconds for this Future.
+
+        Times out with an Err rather than raising, also when a deadline
+        expires. The awaitable in flight is cancelled. Pass None to only
+        capture deadlines.
+        """
+
+        async def with_timeout(x: Awaitable[T]) -> Result[T, asyncio.TimeoutError]:
+            try:
+                return Ok(await asyncio.wait_for(x, seconds))
+            except asyncio.TimeoutError as e:
+                return Err(e)
+
+        return Future(_Captured(with_timeout(self)))
+
+    def _chain(self, step: Step) -> Future[S]:
+        future: Future[S] = Future(self._awaitable)
+        future._steps = push(self._steps, step)
+        return future
+
+    async def _run(self) -> T:
+        steps = unwind(self._steps)
+        at = _deadline.get()
+        if at is None:
+            x = await self._awaitable
+            for bind, function in steps:
+                x = function(x)
+                if bind:
+                    x = await x
+            return x
+        x = await _until(self._awaitable, at)
+        for bind, function in steps:
+            x = function(x)
+            if bind:
+                x = await _until(x, at)
+        return x
 
     @classmethod
     def sequence(cls, xs: Iterable[Awaitable[T]]) -> Future[List[T]]:
         """Evaluate monadic actions in sequence, collecting results."""
 
-        def mcons(acc: Future[List[T]], x: Awaitable[T]) -> Future[List[T]]:
-            future: Future[T] = x if isinstance(x, Future) else Future(x)
-            return acc.bind(lambda acc_: future.map(lambda x_: acc_ + [x_]))
+        async def sequence(awaitables: List[Awaitable[T]]) -> List[T]:
+            return [await x for x in awaitables]
+
+        return Future(sequence(list(xs)))
+
+    @classmethod
+    def gather(
+        cls, xs: Iterable[Awaitable[T]], limit: Optional[int] = None
+    ) -> Future[List[T]]:
+        """Evaluate monadic actions concurrently, collecting results.
+
+        Results are returned in the order of xs. If a limit is given, at
+        most that many actions are awaited at once.
+        """
+
+        if limit is not None and limit < 1:
+            raise ValueError("Concurrency limit must be at least 1")
 
-        empty: Future[List[T]] = cls.pure([])
-        return functools.reduce(mcons, xs, empty)
+        async def gather(awaitables: List[Awaitable[T]]) -> List[T]:
+            if limit is None:
+                return await asyncio.gather(*awaitables)
+            semaphore = asyncio.Semaphore(limit)
+
+            async def bounded(x: Awaitable[T]) -> T:
+                async with semaphore:
+                    return await x
+
+            return await asyncio.gather(*map(bounded, awaitables))
+
+        return Future(gather(list(xs)))
+
+    @classmethod
+    def traverse(
+        cls,
+        function: Callable[[T], Awaitable[S]],
+        xs: Union[Iterable[T], AsyncIterable[T]],
+        limit: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Future[List[S]]:
+        """Apply an action to each item concurrently, collecting results.
+
+        Results are returned in the order of xs, or in the order they
+        complete if not ordered. See stream.
+        """
+
+        results = cls.stream(function, xs, limit, ordered)
+
+        async def traverse() -> List[S]:
+            return [x async for x in results]
+
+        return Future(traverse())
+
+    @classmethod
+    def stream(
+        cls,
+        function: Callable[[T], Awaitable[S]],
+        xs: Union[Iterable[T], AsyncIterable[T]],
+        limit: Optional[int] = None,
+        ordered: bool = True,
+    ) -> AsyncGenerator[S, None]:
+        """Apply an action to each item concurrently, yielding results.
+
+        xs may be an iterable or an async iterable, and is consumed only
+        as actions can be started. If a limit is given, at most that many
+        actions run or have results waiting to be yielded at once. Results
+        are yielded in the order of xs, or as they complete if not
+        ordered. Actions still running are cancelled if one fails or the
+        stream is closed early.
+        """
+
+        if limit is not None and limit < 1:
+            raise ValueError("Concurrency limit must be at least 1")
+        return _stream(function, xs, limit, ordered)
 
     def __await__(self):
         return self.awaitable.__await__()
@@ -63,3 +258,169 @@ class Future(Monad[T]):
     __rshift__ = bind
     __and__ = lambda other, self: Future.apply(self, other)
     __mul__ = __rmul__ = map
+
+
+async def _stream(
+    function: Callable[[T], Awaitable[S]],
+    xs: Union[Iterable[T], AsyncIterable[T]],
+    limit: Optional[int],
+    ordered: bool,
+) -> AsyncGenerator[S, None]:
+    if isinstance(xs, AsyncIterable):
+        items: Union[Iterator[T], AsyncIterator[T]] = xs.__aiter__()
+    else:
+        items = iter(xs)
+    # Running actions by their position in xs, and results of actions that
+    # finished ahead of an earlier one.
+    pending: Dict[asyncio.Future[S], int] = {}
+    results: Dict[int, S] = {}
+    started = yielded = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and (
+                limit is None or len(pending) + len(results) < limit
+            ):
+                try:
+                    if isinstance(items, AsyncIterator):
+                        item = await items.__anext__()
+                    else:
+                        item = next(items)
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+                pending[asyncio.ensure_future(function(item))] = started
+                started += 1
+            if not pending:
+                return
+            for position, task in await _finished(pending):
+                if ordered:
+                    results[position] = task.result()
+                else:
+                    yield task.result()
+            while yielded in results:
+                yield results.pop(yielded)
+                yielded += 1
+    finally:
+        await _cancel(pending)
+
+
+async def _gather(awaitables: Iterable[Awaitable[Any]]) -> List[Any]:
+    """Await actions concurrently, collecting their results in order.
+
+    Unlike asyncio.gather, the actions still running are cancelled and
+    waited for if one fails.
+    """
+    pending: Dict[asyncio.Future[Any], int] = {
+        asyncio.ensure_future(x): i for i, x in enumerate(awaitables)
+    }
+    results: List[Any] = [None] * len(pending)
+    try:
+        while pending:
+            for position, task in await _finished(pending):
+                results[position] = task.result()
+    finally:
+        await _cancel(pending)
+    return results
+
+
+async def _finished(
+    pending: Dict[asyncio.Future[T], int]
+) -> List[Tuple[int, asyncio.Future[T]]]:
+    """Wait for some of the pending tasks, and take them out with positions.
+
+    The finished tasks are returned in order of position. Every error
+    among them is retrieved, so that raising the first one does not leave
+    the others reported as never retrieved.
+    """
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finished = sorted((pending.pop(task), task) for task in done)
+    for _, task in finished:
+        if not task.cancelled():
+            task.exception()
+    return finished
+
+
+async def _cancel(pending: Dict[asyncio.Future[Any], int]) -> None:
+    """Cancel the pending tasks, and wait until they have finished."""
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+
+
+class _Done(Awaitable[T]):
+    """An awaitable with a value already, which never suspends."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: T) -> None:
+        self.value = value
+
+    def __await__(self):
+        return self.value
+        yield  # pragma: no cover
+
+
+class _Captured(Awaitable[T]):
+    """An awaitable handling deadlines itself, which is not bounded by them."""
+
+    __slots__ = ("awaitable",)
+
+    def __init__(self, awaitable: Awaitable[T]) -> None:
+        self.awaitable = awaitable
+
+    def __await__(self):
+        return self.awaitable.__await__()
+
+
+class _Shared(Awaitable[T]):
+    """An awaitable run once as a task, whose outcome every await shares."""
+
+    __slots__ = ("awaitable", "task")
+
+    def __init__(self, awaitable: Awaitable[T]) -> None:
+        self.awaitable = awaitable
+        self.task: Optional[asyncio.Future[T]] = None
+
+    def __await__(self):
+        if self.task is None:
+            # The work is shared, so it must not be bound by the deadline of
+            # whichever consumer happens to start it. Each consumer's own
+            # deadline applies around its shield instead.
+            self.task = copy_context().run(_start, self.awaitable)
+        return asyncio.shield(self.task).__await__()
+
+
+def _start(awaitable: Awaitable[T]) -> asyncio.Future[T]:
+    _deadline.set(None)
+    return asyncio.ensure_future(awaitable)
+
+
+def _until(awaitable: Awaitable[T], at: float) -> Awaitable[T]:
+    """Bound an awaitable by a deadline, given as an event loop time."""
+    if isinstance(awaitable, (Future, _Captured)):
+        # Futures apply the deadline to what they await themselves.
+        return awaitable
+    timeout = at - asyncio.get_running_loop().time()
+    return asyncio.wait_for(awaitable, timeout)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bound the time taken by Futures awaited within the block.
+
+    Must be entered from a coroutine. Once the deadline passes, the
+    awaitable in flight is cancelled and asyncio.TimeoutError is raised.
+    Nested deadlines can only shorten the time allowed. Tasks created
+    within the block inherit the deadline.
+    """
+    at = asyncio.get_running_loop().time() + seconds
+    current = _deadline.get()
+    if current is not None:
+        at = min(at, current)
+    token = _deadline.set(at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    TypeVar,
+    cast,
+)
+
+from .future import Future, _Done, _cancel, _finished
+from .monad import Monad
+from .result import Err, Ok, Result
+
+T = TypeVar("T")
+S = TypeVar("S")
+E = TypeVar("E")
+
+
+class FutureResult(Monad[T], Generic[T, E]):
+    """Wraps an Awaitable Result in a Monad.
+
+    map and bind apply to the Ok value once awaited. After an Err, the
+    remaining functions are skipped without scheduling any further work.
+    The resulting FutureResult object is, itself, Awaitable.
+    """
+
+    __slots__ = ("future",)
+
+    def __init__(self, awaitable: Awaitable[Result[T, E]]) -> None:
+        self.future: Future[Result[T, E]] = (
+            awaitable if isinstance(awaitable, Future) else Future(awaitable)
+        )
+
+    @classmethod
+    def pure(cls, value: T) -> FutureResult[T, E]:
+        return FutureResult(_Done(Ok(value)))
+
+    @classmethod
+    def fromResult(cls, result: Result[T, E]) -> FutureResult[T, E]:
+        return FutureResult(_Done(result))
+
+    @classmethod
+    def fromFuture(cls, future: Awaitable[T]) -> FutureResult[T, E]:
+        """Wrap an awaitable's value in Ok."""
+        return FutureResult(Future(future).map(Ok))
+
+    def map(self, function: Callable[[T], S]) -> FutureResult[S, E]:
+        return FutureResult(self.future.map(lambda result: result.map(function)))
+
+    def mapError(self, function: Callable[[E], S]) -> FutureResult[T, S]:
+        return FutureResult(self.future.map(lambda result: result.mapError(function)))
+
+    def apply(self, functor: FutureResult[Callable[[T], S], E]) -> FutureResult[S, E]:
+        """Apply the function, awaiting it and this concurrently.
+
+        Stops waiting for either as soon as the other is an Err.
+        """
+
+        def apply(results: List[Any]) -> S:
+            f, x = results
+            return f(x)
+
+        both: List[Awaitable[Result[Any, E]]] = [functor, self]
+        return FutureResult.sequence(both).map(apply)
+
+    def bind(
+        self, function: Callable[[T], Awaitable[Result[S, E]]]
+    ) -> FutureResult[S, E]:
+        def bind(result: Result[T, E]) -> Awaitable[Result[S, E]]:
+            if isinstance(result, Ok):
+                return function(result.value)
+            return _Done(cast("Result[S, E]", result))
+
+        return FutureResult(self.future.bind(bind))
+
+    @classmethod
+    def sequence(
+        cls, xs: Iterable[Awaitable[Result[T, E]]]
+    ) -> FutureResult[List[T], E]:
+        """Evaluate monadic actions concurrently, collecting results.
+
+        Results are returned in the order of xs. The first Err is returned
+        as soon as it completes, and the actions still running are
+        cancelled. Of actions completing together, the first in xs wins.
+        """
+
+        async def sequence(
+            awaitables: List[Awaitable[Result[T, E]]]
+        ) -> Result[List[T], E]:
+            pending: Dict[asyncio.Future[Result[T, E]], int] = {
+                asyncio.ensure_future(x): i for i, x in enumerate(awaitables)
+            }
+            values: List[Any] = [None] * len(awaitables)
+            try:
+                while pending:
+                    for position, task in await _finished(pending):
+                        result = task.result()
+                        if isinstance(result, Err):
+                            return cast("Result[List[T], E]", result)
+                        values[position] = cast("Ok[T, E]", result).value
+            finally:
+                await _cancel(pending)
+            return Ok(values)
+
+        return FutureResult(sequence(list(xs)))
+
+    def __await__(self):
+        return self.future.__await__()
+
+    def __repr__(self):  # pragma: no cover
+        return f"<FutureResult {self.future!r}>"
+
+    __rshift__ = bind
+    __and__ = lambda other, self: self.apply(other)
+    __mul__ = __rmul__ = map
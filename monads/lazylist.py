@@ -0,0 +1,116 @@
+from __future__ import annotations
+from itertools import chain, islice, product
+from typing import Callable, Iterable, Iterator, List as _List, TypeVar
+
+from .list import List
+from .monad import Monad
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+
+class _Deferred(Iterable[T]):
+    """An iterable that builds a fresh iterator each time it is iterated."""
+
+    __slots__ = ("function",)
+
+    def __init__(self, function: Callable[[], Iterator[T]]) -> None:
+        self.function = function
+
+    def __iter__(self) -> Iterator[T]:
+        return self.function()
+
+
+class LazyList(Monad[T]):
+    """A sequence of items computed only as they are consumed.
+
+    Operations build a pipeline of iterators over the wrapped iterable, so
+    they work on infinite sources and run in constant memory. Each
+    iteration evaluates the pipeline again; a LazyList over a one-shot
+    iterator, such as a generator, can therefore only be consumed once.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Iterable[T]) -> None:
+        self.value = value
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.value)
+
+    @classmethod
+    def pure(cls, value: T) -> LazyList[T]:
+        return LazyList((value,))
+
+    def bind(self, function: Callable[[T], LazyList[S]]) -> LazyList[S]:
+        return LazyList(
+            _Deferred(lambda: chain.from_iterable(map(function, self.value)))
+        )
+
+    def map(self, function: Callable[[T], S]) -> LazyList[S]:
+        return LazyList(_Deferred(lambda: map(function, self.value)))
+
+    def apply(self, functor: LazyList[Callable[[T], S]]) -> LazyList[S]:
+        """Apply each function to every item, in the order List does.
+
+        The source is iterated again for each function. A one-shot source,
+        such as a generator, is read once instead, and its items are kept
+        for the functions after the first as they are read.
+        """
+
+        def apply() -> Iterator[S]:
+            for f in functor:
+                yield from map(f, self.value)
+
+        def apply_once() -> Iterator[S]:
+            items = iter(self.value)
+            seen: _List[T] = []
+            functions = iter(functor)
+            f = next(functions, None)
+            while f is not None:
+                # Look ahead, so that items are only kept if another
+                # function will need them.
+                following = next(functions, None)
+                yield from map(f, seen)
+                for x in items:
+                    if following is not None:
+                        seen.append(x)
+                    yield f(x)
+                f = following
+
+        if isinstance(self.value, Iterator):
+            return LazyList(_Deferred(apply_once))
+        return LazyList(_Deferred(apply))
+
+    @classmethod
+    def sequence(cls, xs: Iterable[LazyList[T]]) -> LazyList[_List[T]]:
+        """Evaluate monadic actions in sequence, collecting results.
+
+        Each input is consumed in full when the result is first iterated.
+        """
+
+        lists = list(xs)
+        return LazyList(_Deferred(lambda: map(list, product(*lists))))
+
+    def take(self, n: int) -> LazyList[T]:
+        return LazyList(_Deferred(lambda: islice(self.value, n)))
+
+    def drop(self, n: int) -> LazyList[T]:
+        return LazyList(_Deferred(lambda: islice(self.value, n, None)))
+
+    def filter(self, predicate: Callable[[T], bool]) -> LazyList[T]:
+        return LazyList(_Deferred(lambda: filter(predicate, self.value)))
+
+    @classmethod
+    def fromList(cls, xs: List[T]) -> LazyList[T]:
+        return LazyList(xs.value)
+
+    def toList(self) -> List[T]:
+        return List(list(self.value))
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<LazyList {self.value!r}>"
+
+    __rshift__ = bind
+    __and__ = lambda other, self: self.apply(other)
+    __mul__ = __rmul__ = map
@@ -1,8 +1,8 @@
 from __future__ import annotations
-from functools import reduce
-from itertools import chain
-from typing import Callable, Iterable, List as _List, TypeVar
+from itertools import chain, product
+from typing import Any, Callable, Iterable, List as _List, TypeVar, cast
 
+from .functor import Fused
 from .monad import Monad
 from .monoid import Monoidal
 
@@ -11,16 +11,21 @@ S = TypeVar("S")
 
 
 class List(Monad[T], Monoidal[list]):
+    __slots__ = ()
+
     @classmethod
     def pure(cls, value: T) -> List[T]:
         return List([value])
 
     def bind(self, function: Callable[[T], List[S]]) -> List[S]:
-        return reduce(List.mappend, map(function, self.value), List.mzero())
+        return List([y for x in self.value for y in function(x).value])
 
     def map(self, function: Callable[[T], S]) -> List[S]:
         return List(list(map(function, self.value)))
 
+    def fused(self) -> FusedList[T]:
+        return FusedList(self)
+
     def apply(self, functor: List[Callable[[T], S]]) -> List[S]:
         return List(
             list(chain.from_iterable([map(f, self.value) for f in functor.value]))
@@ -30,11 +35,7 @@ class List(Monad[T], Monoidal[list]):
     def sequence(cls, xs: Iterable[List[T]]) -> List[_List[T]]:
         """Evaluate monadic actions in sequence, collecting results."""
 
-        def mcons(acc: List[_List[T]], x: List[T]) -> List[_List[T]]:
-            return acc.bind(lambda acc_: x.map(lambda x_: acc_ + [x_]))
-
-        empty: List[_List[T]] = cls.pure([])
-        return reduce(mcons, xs, empty)
+        return List([list(xs_) for xs_ in product(*(x.value for x in xs))])
 
     @classmethod
     def mzero(cls) -> List[T]:
@@ -43,7 +44,27 @@ class List(Monad[T], Monoidal[list]):
     def mappend(self, other: List[T]) -> List[T]:
         return List(self.value + other.value)
 
+    # Iterable type set to Any, as Monoid.mconcat accepts any monoid.
+    @classmethod
+    def mconcat(cls, xs: Iterable[Any]) -> List[T]:
+        """Concatenate lists in a single pass."""
+        return cls(list(chain.from_iterable(x.value for x in xs)))
+
     __add__ = mappend
     __and__ = lambda other, self: List.apply(self, other)
     __mul__ = __rmul__ = map
     __rshift__ = bind
+
+
+class FusedList(Fused[T]):
+    """Collects consecutive map calls on a List. See Fused."""
+
+    __slots__ = ()
+
+    def map(self, function: Callable[[T], S]) -> FusedList[S]:
+        return FusedList(self.functor, self.functions + (function,))
+
+    def run(self) -> List[T]:
+        return cast(List[T], super().run())
+
+    __mul__ = __rmul__ = map
@@ -1,7 +1,17 @@
 from __future__ import annotations
-import functools
-from typing import Any, Callable, Generic, Iterable, List, Optional, TypeVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
 from . import result
+from .functor import Fused
 from .monad import Monad
 from .monoid import Monoid
 
@@ -11,6 +21,8 @@ E = TypeVar("E")
 
 
 class Maybe(Monad[T]):
+    __slots__ = ()
+
     def __init__(self) -> None:  # pragma: no cover
         raise NotImplementedError
 
@@ -18,52 +30,46 @@ class Maybe(Monad[T]):
     def pure(cls, value: T) -> Maybe[T]:
         return Just(value)
 
-    def bind(self, function: Callable[[T], Maybe[S]]) -> Maybe[S]:
-        if isinstance(self, Just):
-            return function(self.value)
-        else:
-            new: Maybe[S] = Nothing()
-            return new
+    # The combinators below are implemented by Just and Nothing, so that
+    # each call dispatches on the instance's type with a single lookup.
 
-    def map(self, function: Callable[[T], S]) -> Maybe[S]:
-        if isinstance(self, Just):
-            return Just(function(self.value))
-        else:
-            new: Maybe[S] = Nothing()
-            return new
+    def bind(self, function: Callable[[T], Maybe[S]]) -> Maybe[S]:  # pragma: no cover
+        raise NotImplementedError
+
+    def map(self, function: Callable[[T], S]) -> Maybe[S]:  # pragma: no cover
+        raise NotImplementedError
+
+    def fused(self) -> FusedMaybe[T]:
+        return FusedMaybe(self)
 
     def apply(self, functor: Maybe[Callable[[T], S]]) -> Maybe[S]:
-        if isinstance(functor, Just):
-            return self.map(functor.value)
-        else:
-            new: Maybe[S] = Nothing()
-            return new
+        return functor.bind(self.map)
 
     @classmethod
     def sequence(cls, xs: Iterable[Maybe[T]]) -> Maybe[List[T]]:
-        """Evaluate monadic actions in sequence, collecting results."""
+        """Evaluate monadic actions in sequence, collecting results.
 
-        def mcons(acc: Maybe[List[T]], x: Maybe[T]) -> Maybe[List[T]]:
-            return acc.bind(lambda acc_: x.map(lambda x_: acc_ + [x_]))
+        Stops consuming xs at the first Nothing.
+        """
 
-        empty: Maybe[List[T]] = cls.pure([])
-        return functools.reduce(mcons, xs, empty)
+        values: List[T] = []
+        for x in xs:
+            if isinstance(x, Just):
+                values.append(x.value)
+            else:
+                new: Maybe[List[T]] = Nothing()
+                return new
+        return Just(values)
 
-    def withDefault(self, default: T) -> T:
-        if isinstance(self, Just):
-            return self.value
-        else:
-            return default
+    def withDefault(self, default: T) -> T:  # pragma: no cover
+        raise NotImplementedError
 
     @classmethod
     def fromResult(cls, m: result.Result[T, E]) -> Maybe[T]:
         return m.map(Maybe.pure).withDefault(Nothing())
 
-    def toResult(self, error: E) -> result.Result[T, E]:
-        if isinstance(self, Just):
-            return result.Ok(self.value)
-        else:
-            return result.Err(error)
+    def toResult(self, error: E) -> result.Result[T, E]:  # pragma: no cover
+        raise NotImplementedError
 
     @classmethod
     def fromOptional(cls, value: Optional[T]) -> Maybe[T]:
@@ -72,11 +78,8 @@ class Maybe(Monad[T]):
         else:
             return Just(value)
 
-    def toOptional(self) -> Optional[T]:
-        if isinstance(self, Just):
-            return self.value
-        else:
-            return None
+    def toOptional(self) -> Optional[T]:  # pragma: no cover
+        raise NotImplementedError
 
     @classmethod
     def fromList(self, xs: List[T]) -> Maybe[T]:
@@ -86,31 +89,93 @@ class Maybe(Monad[T]):
             return Nothing()
 
     __rshift__ = bind
-    __and__ = lambda other, self: Maybe.apply(self, other)
+    __and__ = lambda other, self: self.apply(other)
     __mul__ = __rmul__ = map
 
 
 class Just(Maybe[T]):
+    __slots__ = ("value",)
+
     def __init__(self, value: T) -> None:
         self.value = value
 
+    def bind(self, function: Callable[[T], Maybe[S]]) -> Maybe[S]:
+        return function(self.value)
+
+    def map(self, function: Callable[[T], S]) -> Maybe[S]:
+        return Just(function(self.value))
+
+    def withDefault(self, default: T) -> T:
+        return self.value
+
+    def toResult(self, error: E) -> result.Result[T, E]:
+        return result.Ok(self.value)
+
+    def toOptional(self) -> Optional[T]:
+        return self.value
+
     def __eq__(self, other: object):
         return isinstance(other, Just) and self.value == other.value
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"<Just {self.value}>"
 
+    __rshift__ = bind
+    __mul__ = __rmul__ = map
+
 
 class Nothing(Maybe[T]):
+    __slots__ = ()
+
+    # Nothing carries no data, so every Nothing() is the same instance.
+    _instance: ClassVar[Optional[Nothing]] = None
+
+    def __new__(cls) -> Nothing[T]:
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self) -> None:
         ...
 
+    def bind(self, function: Callable[[T], Maybe[S]]) -> Maybe[S]:
+        return cast("Maybe[S]", self)
+
+    def map(self, function: Callable[[T], S]) -> Maybe[S]:
+        return cast("Maybe[S]", self)
+
+    def withDefault(self, default: T) -> T:
+        return default
+
+    def toResult(self, error: E) -> result.Result[T, E]:
+        return result.Err(error)
+
+    def toOptional(self) -> Optional[T]:
+        return None
+
     def __eq__(self, other: object):
         return isinstance(other, Nothing)
 
     def __repr__(self) -> str:  # pragma: no cover
         return "<Nothing>"
 
+    __rshift__ = bind
+    __mul__ = __rmul__ = map
+
+
+class FusedMaybe(Fused[T]):
+    """Collects consecutive map calls on a Maybe. See Fused."""
+
+    __slots__ = ()
+
+    def map(self, function: Callable[[T], S]) -> FusedMaybe[S]:
+        return FusedMaybe(self.functor, self.functions + (function,))
+
+    def run(self) -> Maybe[T]:
+        return cast(Maybe[T], super().run())
+
+    __mul__ = __rmul__ = map
+
 
 def maybe(value: T, predicate: Optional[Callable[[T], bool]] = None) -> Maybe[T]:
     predicate = predicate or (lambda x: x is not None)
@@ -121,9 +186,11 @@ def maybe(value: T, predicate: Optional[Callable[[T], bool]] = None) -> Maybe[T]
 
 
 class First(Monoid[Maybe[T]]):
+    __slots__ = ()
+
     @classmethod
     def mzero(cls) -> First:
-        return First(Nothing())
+        return cls.interned(Nothing())
 
     def mappend(self, other: First):
         if isinstance(self.value, Just):
@@ -142,9 +209,11 @@ def first(xs: List[Maybe[T]]) -> Maybe[T]:
 
 
 class Last(Monoid[Maybe[T]]):
+    __slots__ = ()
+
     @classmethod
     def mzero(cls) -> Last:
-        return Last(Nothing())
+        return cls.interned(Nothing())
 
     def mappend(self, other: Last):
         if isinstance(other.value, Just):
@@ -10,6 +10,8 @@ S = TypeVar("S")
 
 
 class Monad(Applicative[T]):
+    __slots__ = ()
+
     # FIXME: Callable return type set to Any, as the proper value
     # (Monad[S]) is reported as incompatible with subclass
     # implementations due to a flaw in mypy:
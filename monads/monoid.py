@@ -2,14 +2,28 @@ from __future__ import annotations
 from functools import reduce
 from numbers import Complex
 from decimal import Decimal
-from typing import Any, Callable, Generic, Iterator, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, Iterator, Type, TypeVar, Union
 
 T = TypeVar("T")
+M = TypeVar("M", bound="Monoid")
+
+# Shared identity values, keyed by monoid class.
+_identities: Dict[type, Any] = {}
 
 
 class Monoid(Generic[T]):
+    __slots__ = ("value",)
+
+    value: T
+
     def __init__(self, value: T) -> None:
-        self.value = value
+        # Set through object, skipping the check for interned instances.
+        object.__setattr__(self, "value", value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if _identities.get(type(self)) is self:
+            raise AttributeError(f"{type(self).__name__}.mzero() cannot be modified")
+        object.__setattr__(self, name, value)
 
     # FIXME: Other type set to Any, as the proper value (Monoid[T]) is
     # reported as incompatible with subclass implementations due to a
@@ -21,6 +35,18 @@ class Monoid(Generic[T]):
     def mzero(cls) -> Monoid[T]:  # pragma: no cover
         raise NotImplementedError
 
+    @classmethod
+    def interned(cls: Type[M], value: Any) -> M:
+        """Return a single shared instance of this monoid wrapping value.
+
+        Only suitable for identity values that are never mutated, such as
+        those returned by mzero. The instance rejects assignment.
+        """
+        try:
+            return _identities[cls]
+        except KeyError:
+            return _identities.setdefault(cls, cls(value))
+
     @classmethod
     def mconcat(cls, xs: Iterator[Monoid[T]]) -> Monoid[T]:
         return reduce(cls.mappend, xs, cls.mzero())
@@ -36,14 +62,18 @@ class Monoid(Generic[T]):
 
 
 class Monoidal(Monoid[T]):
+    __slots__ = ()
+
     def __repr__(self):  # pragma: no cover
         return repr(self.value)
 
 
 class String(Monoidal[str]):
+    __slots__ = ()
+
     @classmethod
     def mzero(cls) -> Monoidal:
-        return cls(str())
+        return cls.interned(str())
 
     def mappend(self, other: String) -> String:
         return String(self.value + other.value)
@@ -52,9 +82,11 @@ class String(Monoidal[str]):
 
 
 class Addition(Monoidal[Union[int, float]]):
+    __slots__ = ()
+
     @classmethod
     def mzero(cls) -> Addition:
-        return cls(0)
+        return cls.interned(0)
 
     def mappend(self, other: Addition) -> Addition:
         return Addition(self.value + other.value)
@@ -63,9 +95,11 @@ class Addition(Monoidal[Union[int, float]]):
 
 
 class Multiplication(Monoidal[Union[int, float]]):
+    __slots__ = ()
+
     @classmethod
     def mzero(cls) -> Multiplication:
-        return cls(1)
+        return cls.interned(1)
 
     def mappend(self, other: Multiplication) -> Multiplication:
         return Multiplication(self.value * other.value)
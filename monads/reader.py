@@ -1,23 +1,178 @@
 from __future__ import annotations
-from functools import reduce, update_wrapper
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar
+from functools import update_wrapper
 import inspect
-from typing import Any, Callable, Generic, Iterable, List, TypeVar
+from itertools import islice
+import os
+import threading
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from weakref import WeakKeyDictionary
 
+from .functor import Steps, compose, push, unwind
 from .monad import Monad
 
 T = TypeVar("T")
 S = TypeVar("S")
 Env = TypeVar("Env")
+Env2 = TypeVar("Env2")
 F = Callable[[Env], T]
 
 
+# The kinds of step a Reader can be composed of.
+_MAP, _BIND, _APPLY = range(3)
+
+# A step in a Reader's composition: its kind and the function it applies.
+Step = Tuple[int, Callable[[Any], Any]]
+
+# A token identifying the outermost call in progress of a Reader using
+# shared readers, which they use to tell one run from the next.
+_run: ContextVar[Optional[object]] = ContextVar("run", default=None)
+
+
 class Reader(Monad[T], Generic[Env, T]):
+    """Represents a computation reading from a shared environment.
+
+    map, bind and apply record their functions as a flat list of steps
+    rather than wrapping the previous function, and calling the Reader
+    runs those steps in a loop. Compositions of any depth therefore run
+    in constant stack depth. Consecutive maps are fused into one step.
+    """
+
+    # Whether the composition uses shared readers, so that calling it must
+    # start a run for them. Others run without that cost.
+    _shared = False
+
     def __init__(self, function: F) -> None:
         update_wrapper(self, function)
-        self.function = function
+        self._source: Callable[[Env], Any] = function
+        if getattr(function, "_shared", False):
+            self._shared = True
+        # The steps are flattened into a plan the first time the Reader runs.
+        self._steps: Steps[Step] = None
+        self._plan: Optional[Tuple[Step, ...]] = None
+        self._applied: List[Callable[[Env], Any]] = []
+
+    @property
+    def function(self) -> Callable[[Env], T]:
+        if self._steps is None:
+            return self._source
+        return self.__call__
 
     def __call__(self, environment: Env) -> T:
-        return self.function(environment)
+        if self._shared and _run.get() is None:
+            return self._run(environment)
+        if self._steps is None:
+            return self._source(environment)
+        plan = self._plan
+        if plan is None:
+            plan = self._compile()
+        # The readers given to apply run before the rest of the composition,
+        # the last one first, as they did when each apply wrapped the Reader
+        # before it. Their functions are then taken in the order of the plan.
+        applied = self._applied
+        if applied:
+            applied = [r(environment) for r in applied]
+        value = self._source(environment)
+        for kind, function in plan:
+            if kind == _MAP:
+                value = function(value)
+            elif kind == _BIND:
+                value = function(value)(environment)
+            else:
+                value = applied.pop()(value)
+        return value
+
+    def _run(self, environment: Env) -> T:
+        token = _run.set(object())
+        try:
+            return self(environment)
+        finally:
+            _run.reset(token)
+
+    def run_many(
+        self,
+        environments: Iterable[Env],
+        executor: Optional[Executor] = None,
+        chunksize: int = 1,
+        window: Optional[int] = None,
+    ) -> Iterator[T]:
+        """Run this Reader against each environment, yielding results in order.
+
+        The composition is flattened once and reused for every run. Given
+        an executor, the runs are spread across it, chunksize
+        environments at a time. Environments are read only as results are
+        consumed: at most window chunks are submitted and not yet yielded,
+        by default twice the number of CPUs. Process pools need the
+        Reader and its functions to be picklable, so they must be defined
+        at module level rather than as lambdas or closures.
+        """
+        if chunksize < 1:
+            raise ValueError("Chunk size must be at least 1")
+        if window is None:
+            window = 2 * (os.cpu_count() or 1)
+        elif window < 1:
+            raise ValueError("Window must be at least 1")
+        if self._steps is not None and self._plan is None:
+            self._compile()
+        if executor is None:
+            return map(self, environments)
+        return _run_many(self, environments, executor, chunksize, window)
+
+    def _compile(self) -> Tuple[Step, ...]:
+        """Flatten the steps into the plan run by __call__, and cache it."""
+        # Fuse runs of consecutive maps into a single step.
+        plan: List[Step] = []
+        maps: List[Callable[[Any], Any]] = []
+        for kind, function in unwind(self._steps):
+            if kind == _MAP:
+                maps.append(function)
+                continue
+            if maps:
+                plan.append((_MAP, compose(maps)))
+                maps = []
+            plan.append((kind, function))
+        if maps:
+            plan.append((_MAP, compose(maps)))
+        self._applied = [f for kind, f in reversed(plan) if kind == _APPLY]
+        self._plan = tuple(plan)
+        return self._plan
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The plan may hold composed closures, which cannot be pickled. It
+        # is compiled again from the steps when needed.
+        state = dict(self.__dict__)
+        state["_plan"] = None
+        return state
+
+    def _chain(self, step: Step) -> Reader[Env, S]:
+        reader: Reader[Env, S] = Reader.__new__(Reader)
+        if type(self).__call__ is Reader.__call__:
+            reader._source = self._source
+            reader._steps = push(self._steps, step)
+        else:
+            # Subclasses may run differently, so treat them as a source.
+            reader._source = self
+            reader._steps = push(None, step)
+        reader._plan = None
+        if self._shared or getattr(step[1], "_shared", False):
+            reader._shared = True
+        return reader
 
     @classmethod
     def pure(cls, value: T) -> Reader[Env, T]:
@@ -40,36 +195,181 @@ class Reader(Monad[T], Generic[Env, T]):
         return cls(constant())
 
     def map(self, function: Callable[[T], S]) -> Reader[Env, S]:
-        f: Callable[[Env], S] = lambda x: function(self.function(x))
-        return Reader(f)
+        return self._chain((_MAP, function))
 
     def apply(self, r: Reader[Env, Callable[[T], S]]) -> Reader[Env, S]:
-        f: Callable[[Env], S] = lambda x: r.function(x)(self(x))
-        return Reader(f)
+        return self._chain((_APPLY, r))
 
     def bind(self, function: Callable[[T], Reader[Env, S]]) -> Reader[Env, S]:
-        f: Callable[[Env], S] = lambda x: function(self.function(x))(x)
+        return self._chain((_BIND, function))
+
+    def local(self, function: Callable[[Env2], Env]) -> Reader[Env2, T]:
+        """Run this Reader against an environment derived from another."""
+
+        f: Callable[[Env2], T] = lambda x: self(function(x))
+        return Reader(f)
+
+    @classmethod
+    def asks(cls, function: Callable[[Env], T]) -> Reader[Env, T]:
+        """Read a value projected from the environment."""
+        return Reader(function)
+
+    @classmethod
+    def ask(cls) -> Reader[Env, Env]:
+        """Read the environment itself."""
+
+        f: Callable[[Env], Env] = lambda x: x
         return Reader(f)
 
+    def shared(self) -> SharedReader[Env, T]:
+        """Run this Reader once per run of a composition using it.
+
+        However often a shared Reader is used within a composition, or by
+        Readers called while the composition runs, it runs only once for
+        each call of the outermost Reader and the same environment, which
+        is compared by identity. The outermost Reader is the first one
+        called that was built from the shared Reader with map, bind, apply
+        or sequence; a shared Reader called only from within plain
+        functions runs on each call. The result is computed again on the
+        next call. The last environment and result are kept alive until
+        then. To keep results across calls, use memoized.
+        """
+        return SharedReader(self)
+
+    def memoized(
+        self, maxsize: Optional[int] = 128, weak: bool = False
+    ) -> MemoizedReader[Env, T]:
+        """Cache this Reader's results by environment.
+
+        Keeps up to maxsize results, discarding the least recently used,
+        or any number of them if maxsize is None. With weak=True, results
+        are instead dropped once their environment is garbage collected,
+        and maxsize is ignored. Environments must be hashable, and weakly
+        referenceable for the weak variant.
+        """
+        return MemoizedReader(self, maxsize, weak)
+
     @classmethod
     def sequence(cls, xs: Iterable[Reader[Env, T]]) -> Reader[Env, List[T]]:
         """Evaluate monadic actions in sequence, collecting results."""
 
-        def mcons(acc: Reader[Env, List[T]], x: Reader[Env, T]) -> Reader[Env, List[T]]:
-            return acc.bind(lambda acc_: x.map(lambda x_: acc_ + [x_]))
-
-        empty: Reader[Env, List[T]] = cls.pure([])
-        return reduce(mcons, xs, empty)
+        readers = list(xs)
+        f: Callable[[Env], List[T]] = lambda x: [reader(x) for reader in readers]
+        reader: Reader[Env, List[T]] = Reader(f)
+        if any(getattr(r, "_shared", False) for r in readers):
+            reader._shared = True
+        return reader
 
     def __eq__(self, other: object):  # pragma: no cover
         return isinstance(other, Reader) and self.function == other.function
 
     def __repr__(self):  # pragma: no cover
-        module = self.function.__module__
-        name = getattr(self.function, "__name__", repr(self.function))
+        module = self._source.__module__
+        name = getattr(self._source, "__name__", repr(self._source))
         signature = inspect.signature(self)
         return f"<Reader {module}.{name}{signature}>"
 
     __mul__ = __rmul__ = map
     __rshift__ = bind
-    __and__ = lambda other, self: Reader.apply(self, other)
+    __and__ = lambda other, self: self.apply(other)
+
+
+def _run_many(
+    reader: Reader[Env, T],
+    environments: Iterable[Env],
+    executor: Executor,
+    chunksize: int,
+    window: int,
+) -> Iterator[T]:
+    items = iter(environments)
+    chunks = iter(lambda: list(islice(items, chunksize)), [])
+    futures: Deque[Future[List[T]]] = deque()
+    try:
+        for chunk in chunks:
+            futures.append(executor.submit(_run_chunk, reader, chunk))
+            if len(futures) >= window:
+                yield from futures.popleft().result()
+        while futures:
+            yield from futures.popleft().result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _run_chunk(reader: Reader[Env, T], environments: List[Env]) -> List[T]:
+    return [reader(environment) for environment in environments]
+
+
+class SharedReader(Reader[Env, T]):
+    """A Reader reusing its result within a run. See Reader.shared."""
+
+    _shared = True
+
+    def __init__(self, reader: Reader[Env, T]) -> None:
+        super().__init__(reader)
+        self._last: Optional[Tuple[object, Env, T]] = None
+
+    def __call__(self, environment: Env) -> T:
+        run = _run.get()
+        if run is None:
+            return self._run(environment)
+        # The run, environment and result are replaced together, so
+        # concurrent callers never see a result for another run.
+        last = self._last
+        if last is not None and last[0] is run and last[1] is environment:
+            return last[2]
+        value = self._source(environment)
+        self._last = (run, environment, value)
+        return value
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class MemoizedReader(Reader[Env, T]):
+    """A Reader caching its results by environment. See Reader.memoized."""
+
+    def __init__(
+        self, reader: Reader[Env, T], maxsize: Optional[int] = 128, weak: bool = False
+    ) -> None:
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("Cache size must be at least 0")
+        super().__init__(reader)
+        self._cache: MutableMapping[Env, T] = (
+            WeakKeyDictionary() if weak else OrderedDict()
+        )
+        self._maxsize = None if weak else maxsize
+        self._hits = self._misses = 0
+        # The lock guards the cache only, so concurrent misses for the same
+        # environment may each run the reader.
+        self._lock = threading.Lock()
+
+    def __call__(self, environment: Env) -> T:
+        cache = self._cache
+        with self._lock:
+            if environment in cache:
+                self._hits += 1
+                if isinstance(cache, OrderedDict):
+                    cache.move_to_end(environment)
+                return cache[environment]
+            self._misses += 1
+        value = self._source(environment)
+        with self._lock:
+            cache[environment] = value
+            if self._maxsize is not None and isinstance(cache, OrderedDict):
+                while len(cache) > self._maxsize:
+                    cache.popitem(last=False)
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
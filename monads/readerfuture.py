@@ -0,0 +1,183 @@
+from __future__ import annotations
+import asyncio
+import inspect
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from .functor import Steps, push, unwind
+from .future import Future, _Done
+from .monad import Monad
+from .reader import Reader
+
+T = TypeVar("T")
+S = TypeVar("S")
+Env = TypeVar("Env")
+
+
+async def _resolve(value: Union[Awaitable[T], T]) -> T:
+    """Await a value if it is awaitable, so functions may be sync or async."""
+    if inspect.isawaitable(value):
+        return await value
+    return value  # type: ignore
+
+
+def _awaitable(value: Union[Awaitable[T], T]) -> Awaitable[T]:
+    """Make a value awaitable, without suspending if it is not already."""
+    if inspect.isawaitable(value):
+        return value
+    return _Done(value)  # type: ignore
+
+
+_MAP, _BIND, _APPLY = range(3)
+
+# A step in a ReaderFuture's composition: its kind and the function it
+# applies, or the ReaderFuture given to apply.
+Step = Tuple[int, Callable[[Any], Any]]
+
+
+class ReaderFuture(Monad[T], Generic[Env, T]):
+    """Represents an asynchronous computation reading from a shared environment.
+
+    Calling a ReaderFuture with an environment returns a Future. Functions
+    given to map and bind may be plain functions or coroutine functions.
+    apply and sequence run their independent computations concurrently.
+
+    map, bind and apply record their functions as a flat list of steps,
+    which become the steps of the Future returned for each environment.
+    Chains of any length therefore run in constant stack depth.
+    """
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(self, function: Callable[[Env], Awaitable[T]]) -> None:
+        self._source: Callable[[Env], Awaitable[Any]] = function
+        self._steps: Steps[Step] = None
+
+    @property
+    def function(self) -> Callable[[Env], Awaitable[T]]:
+        if self._steps is None:
+            return self._source
+        return self.__call__
+
+    def __call__(self, environment: Env) -> Future[T]:
+        future: Future[Any] = Future(self._source(environment))
+        if self._steps is None:
+            return future
+        for kind, function in unwind(self._steps):
+            if kind == _MAP:
+                future = future.bind(_Map(function))
+            elif kind == _BIND:
+                future = future.bind(_Bind(function, environment))
+            else:
+                future = Future.map2(_call, function(environment), future)
+        return future
+
+    def _chain(self, step: Step) -> ReaderFuture[Env, S]:
+        reader: ReaderFuture[Env, S] = ReaderFuture(self._source)
+        reader._steps = push(self._steps, step)
+        return reader
+
+    @classmethod
+    def pure(cls, value: T) -> ReaderFuture[Env, T]:
+        async def constant(_: Env) -> T:
+            return value
+
+        return ReaderFuture(constant)
+
+    @overload
+    @classmethod
+    def lift(cls, reader: Reader[Env, Awaitable[T]]) -> ReaderFuture[Env, T]:
+        ...
+
+    @overload
+    @classmethod
+    def lift(cls, reader: Reader[Env, T]) -> ReaderFuture[Env, T]:
+        ...
+
+    @classmethod
+    def lift(cls, reader):
+        """Run a Reader, awaiting its result if it returns an awaitable."""
+
+        async def lifted(environment):
+            return await _resolve(reader(environment))
+
+        return ReaderFuture(lifted)
+
+    def map(
+        self, function: Callable[[T], Union[Awaitable[S], S]]
+    ) -> ReaderFuture[Env, S]:
+        return self._chain((_MAP, function))
+
+    def apply(self, r: ReaderFuture[Env, Callable[[T], S]]) -> ReaderFuture[Env, S]:
+        return self._chain((_APPLY, r))
+
+    def bind(
+        self,
+        function: Callable[
+            [T], Union[Awaitable[ReaderFuture[Env, S]], ReaderFuture[Env, S]]
+        ],
+    ) -> ReaderFuture[Env, S]:
+        return self._chain((_BIND, function))
+
+    @classmethod
+    def sequence(cls, xs: Iterable[ReaderFuture[Env, T]]) -> ReaderFuture[Env, List[T]]:
+        """Evaluate monadic actions concurrently, collecting results in order."""
+
+        readers = list(xs)
+
+        async def sequence(environment: Env) -> List[T]:
+            return list(await asyncio.gather(*(r(environment) for r in readers)))
+
+        return ReaderFuture(sequence)
+
+    def __repr__(self):  # pragma: no cover
+        return f"<ReaderFuture {self._source!r}>"
+
+    __mul__ = __rmul__ = map
+    __rshift__ = bind
+    __and__ = lambda other, self: self.apply(other)
+
+
+def _call(f: Callable[[T], S], x: T) -> S:
+    return f(x)
+
+
+class _Map:
+    """A map step, awaiting the function's result if it is awaitable."""
+
+    __slots__ = ("function",)
+
+    def __init__(self, function: Callable[[Any], Any]) -> None:
+        self.function = function
+
+    def __call__(self, x: Any) -> Awaitable[Any]:
+        return _awaitable(self.function(x))
+
+
+class _Bind:
+    """A bind step, running the resulting ReaderFuture in the environment."""
+
+    __slots__ = ("function", "environment")
+
+    def __init__(self, function: Callable[[Any], Any], environment: Any) -> None:
+        self.function = function
+        self.environment = environment
+
+    def __call__(self, x: Any) -> Awaitable[Any]:
+        reader = self.function(x)
+        if isinstance(reader, ReaderFuture):
+            return reader(self.environment)
+        return self._run(reader)
+
+    async def _run(self, reader: Awaitable[ReaderFuture[Any, Any]]) -> Any:
+        return await (await reader)(self.environment)
@@ -1,8 +1,8 @@
 from __future__ import annotations
-import functools
-from typing import Any, Callable, Generic, Iterable, List, Optional, TypeVar
+from typing import Any, Callable, Generic, Iterable, List, Optional, TypeVar, cast
 
 from . import maybe
+from .functor import Fused
 from .monad import Monad
 
 T = TypeVar("T")
@@ -11,6 +11,8 @@ E = TypeVar("E")
 
 
 class Result(Monad[T], Generic[T, E]):
+    __slots__ = ()
+
     def __init__(self) -> None:  # pragma: no cover
         raise NotImplementedError
 
@@ -18,63 +20,52 @@ class Result(Monad[T], Generic[T, E]):
     def pure(cls, value: T) -> Result[T, E]:
         return Ok(value)
 
-    def bind(self, function: Callable[[T], Result[S, E]]) -> Result[S, E]:
-        if isinstance(self, Ok):
-            return function(self.value)
-        elif isinstance(self, Err):
-            new: Result[S, E] = Err(self.err)
-            return new
-        else:  # pragma: no cover
-            raise TypeError
+    # The combinators below are implemented by Ok and Err, so that each
+    # call dispatches on the instance's type with a single lookup.
 
-    def map(self, function: Callable[[T], S]) -> Result[S, E]:
-        if isinstance(self, Ok):
-            return Result.pure(function(self.value))
-        elif isinstance(self, Err):
-            new: Result[S, E] = Err(self.err)
-            return new
-        else:  # pragma: no cover
-            raise TypeError
+    def bind(
+        self, function: Callable[[T], Result[S, E]]
+    ) -> Result[S, E]:  # pragma: no cover
+        raise NotImplementedError
 
-    def mapError(self, function: Callable[[E], S]) -> Result[T, S]:
-        if isinstance(self, Err):
-            return Err(function(self.err))
-        elif isinstance(self, Ok):
-            return Ok(self.value)
-        else:  # pragma: no cover
-            raise TypeError
+    def map(self, function: Callable[[T], S]) -> Result[S, E]:  # pragma: no cover
+        raise NotImplementedError
+
+    def fused(self) -> FusedResult[T, E]:
+        return FusedResult(self)
+
+    def mapError(self, function: Callable[[E], S]) -> Result[T, S]:  # pragma: no cover
+        raise NotImplementedError
 
     def apply(self, functor: Result[Callable[[T], S], E]) -> Result[S, E]:
-        if isinstance(functor, Ok):
-            return self.map(functor.value)
-        elif isinstance(functor, Err):
-            new: Result[S, E] = Err(functor.err)
-            return new
-        else:  # pragma: no cover
-            raise TypeError
+        return functor.bind(self.map)
 
     @classmethod
     def sequence(cls, xs: Iterable[Result[T, E]]) -> Result[List[T], E]:
-        """Evaluate monadic actions in sequence, collecting results."""
-
-        def mcons(acc: Result[List[T], E], x: Result[T, E]) -> Result[List[T], E]:
-            return acc.bind(lambda acc_: x.map(lambda x_: acc_ + [x_]))
-
-        empty: Result[List[T], E] = cls.pure([])
-        return functools.reduce(mcons, xs, empty)
-
-    def withDefault(self, default: T) -> T:
-        if isinstance(self, Ok):
-            return self.value
-        else:
-            return default
+        """Evaluate monadic actions in sequence, collecting results.
+
+        Stops consuming xs at the first Err.
+        """
+
+        values: List[T] = []
+        for x in xs:
+            if isinstance(x, Ok):
+                values.append(x.value)
+            elif isinstance(x, Err):
+                return cast("Result[List[T], E]", x)
+            else:  # pragma: no cover
+                raise TypeError
+        return Ok(values)
+
+    def withDefault(self, default: T) -> T:  # pragma: no cover
+        raise NotImplementedError
 
     @classmethod
     def fromMaybe(cls, m: maybe.Maybe[T], error: E) -> Result[T, E]:
         return m.map(Result.pure).withDefault(Err(error))
 
-    def toMaybe(self) -> maybe.Maybe[T]:
-        return self.map(maybe.Maybe.pure).withDefault(maybe.Nothing())
+    def toMaybe(self) -> maybe.Maybe[T]:  # pragma: no cover
+        raise NotImplementedError
 
     @classmethod
     def fromOptional(cls, value: Optional[T], error: E) -> Result[T, E]:
@@ -83,38 +74,97 @@ class Result(Monad[T], Generic[T, E]):
         else:
             return Ok(value)
 
-    def toOptional(self) -> Optional[T]:
-        if isinstance(self, Ok):
-            return self.value
-        else:
-            return None
+    def toOptional(self) -> Optional[T]:  # pragma: no cover
+        raise NotImplementedError
 
     __rshift__ = bind
-    __and__ = lambda other, self: Result.apply(self, other)
+    __and__ = lambda other, self: self.apply(other)
     __mul__ = __rmul__ = map
 
 
 class Ok(Result[T, E]):
+    __slots__ = ("value",)
+
     def __init__(self, value: T) -> None:
         self.value = value
 
+    def bind(self, function: Callable[[T], Result[S, E]]) -> Result[S, E]:
+        return function(self.value)
+
+    def map(self, function: Callable[[T], S]) -> Result[S, E]:
+        return Ok(function(self.value))
+
+    def mapError(self, function: Callable[[E], S]) -> Result[T, S]:
+        return cast("Result[T, S]", self)
+
+    def withDefault(self, default: T) -> T:
+        return self.value
+
+    def toMaybe(self) -> maybe.Maybe[T]:
+        return maybe.Just(self.value)
+
+    def toOptional(self) -> Optional[T]:
+        return self.value
+
     def __eq__(self, other: object):
         return isinstance(other, Ok) and self.value == other.value
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"<Ok {self.value}>"
 
+    __rshift__ = bind
+    __mul__ = __rmul__ = map
+
 
 class Err(Result[T, E]):
+    __slots__ = ("err",)
+
     def __init__(self, err: E) -> None:
         self.err = err
 
+    # An Err holds no value of type T, so it can be passed on as is.
+
+    def bind(self, function: Callable[[T], Result[S, E]]) -> Result[S, E]:
+        return cast("Result[S, E]", self)
+
+    def map(self, function: Callable[[T], S]) -> Result[S, E]:
+        return cast("Result[S, E]", self)
+
+    def mapError(self, function: Callable[[E], S]) -> Result[T, S]:
+        return Err(function(self.err))
+
+    def withDefault(self, default: T) -> T:
+        return default
+
+    def toMaybe(self) -> maybe.Maybe[T]:
+        return maybe.Nothing()
+
+    def toOptional(self) -> Optional[T]:
+        return None
+
     def __eq__(self, other: object):
         return isinstance(other, Err) and self.err == other.err
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"<Err {self.err}>"
 
+    __rshift__ = bind
+    __mul__ = __rmul__ = map
+
+
+class FusedResult(Fused[T], Generic[T, E]):
+    """Collects consecutive map calls on a Result. See Fused."""
+
+    __slots__ = ()
+
+    def map(self, function: Callable[[T], S]) -> FusedResult[S, E]:
+        return FusedResult(self.functor, self.functions + (function,))
+
+    def run(self) -> Result[T, E]:
+        return cast(Result[T, E], super().run())
+
+    __mul__ = __rmul__ = map
+
 
 def safe(function: Callable[..., T]) -> Callable[..., Result[T, Exception]]:
     """Wraps a function that may raise an exception.
@@ -1,5 +1,11 @@
+import functools
 import inspect
-from monads.currying import curry
+import operator
+
+import pytest  # type: ignore
+from typing import Any, Callable
+
+from monads.currying import curry, uncurry
 
 
 def test_curry() -> None:
@@ -37,3 +43,116 @@ def test_curried_function_annotation_drops_arguments_as_it_is_applied() -> None:
         ],
         return_annotation=int,
     ) == inspect.signature(curry(add3)(1))
+
+
+def test_partially_applied_function_can_be_reused() -> None:
+    def add3(a: int, b: int, c: int) -> int:
+        return a + b + c
+
+    add_one = curry(add3)(1)
+    assert 6 == add_one(2)(3)
+    assert 15 == add_one(10)(4)
+    assert 6 == add_one(2)(3)
+
+
+def test_curried_function_keeps_name_and_docstring() -> None:
+    def add3(a: int, b: int, c: int) -> int:
+        """Add three numbers."""
+        return a + b + c
+
+    curried = curry(add3)(1)
+    assert "add3" == getattr(curried, "__name__")
+    assert "Add three numbers." == curried.__doc__
+
+
+def test_call_curried_function_with_some_arguments() -> None:
+    @curry
+    def add3(a: int, b: int, c: int) -> int:
+        return a + b + c
+
+    assert 6 == add3(1, 2)(3)
+    assert 6 == add3(1)(2, 3)
+
+
+def test_uncurry() -> None:
+    def add3(a: int, b: int, c: int) -> int:
+        return a + b + c
+
+    assert 6 == uncurry(curry(add3))(1, 2, 3)
+    assert 6 == uncurry(curry(add3)(1))(2, 3)
+
+
+def test_curry_builtin() -> None:
+    add = curry(operator.add)
+    assert 3 == add(1)(2)
+
+
+def test_curry_partial() -> None:
+    def add3(a: int, b: int, c: int) -> int:
+        return a + b + c
+
+    # functools.partial is typed as taking any arguments.
+    curried: Any = curry(functools.partial(add3, 1))
+    assert 6 == curried(2)(3)
+
+
+def test_curry_bound_method() -> None:
+    class Multiplier:
+        def __init__(self, factor: int) -> None:
+            self.factor = factor
+
+        def multiply(self, a: int, b: int) -> int:
+            return a * b * self.factor
+
+    assert 24 == curry(Multiplier(2).multiply)(3)(4)
+
+
+def test_curry_more_than_five_arguments() -> None:
+    def add6(a: int, b: int, c: int, d: int, e: int, f: int) -> int:
+        return a + b + c + d + e + f
+
+    curried = curry(add6)
+    assert 21 == curried(1)(2)(3)(4)(5)(6)
+    assert 21 == curried(1, 2, 3)(4, 5, 6)
+
+
+def test_curry_keyword_only_arguments() -> None:
+    def scale(a: int, b: int, *, factor: int, offset: int = 0) -> int:
+        return (a + b) * factor + offset
+
+    curried = curry(scale)
+    assert 9 == curried(1, factor=3)(2)
+    assert 10 == curried(1, factor=3)(2, offset=1)
+    assert ["a", "b", "factor", "offset"] == list(inspect.signature(curried).parameters)
+
+
+def test_curry_with_explicit_arity() -> None:
+    assert 4 == curry(max, 2)(3)(4)
+
+
+def test_curry_without_signature_requires_arity() -> None:
+    with pytest.raises(ValueError):
+        curry(max)
+
+
+def test_curry_without_arguments() -> None:
+    with pytest.raises(ValueError):
+        curry(lambda: 1)
+
+
+def test_call_curried_function_with_extra_arguments() -> None:
+    def add(a: int, b: int) -> Callable[[int], int]:
+        return lambda c: a + b + c
+
+    # Over-application is not covered by the curried overloads.
+    curried: Any = curry(add)
+    assert 6 == curried(1, 2, 3)
+
+
+def test_uncurried_function_accepts_fewer_arguments() -> None:
+    def add3(a: int, b: int, c: int) -> int:
+        return a + b + c
+
+    uncurried: Any = uncurry(curry(add3))
+    assert 6 == uncurried(1)(2)(3)
+    assert 6 == uncurried(1, 2)(3)
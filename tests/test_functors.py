@@ -31,3 +31,21 @@ def test_map_rmul_operator(monad) -> None:
     m: Functor = monad.pure(3)
     identity: Callable[[T], T] = lambda x: x
     assert m.map(identity) == identity * m
+
+
+def test_fused_maps(monad) -> None:
+    f: Callable[[int], int] = lambda x: x + 1
+    g: Callable[[int], str] = lambda x: str(x)
+    m: Functor = monad.pure(3)
+    assert m.map(f).map(g) == m.fused().map(f).map(g).run()
+
+
+def test_fused_without_maps(monad) -> None:
+    m: Functor = monad.pure(3)
+    assert m is m.fused().run()
+
+
+def test_fused_map_operator(monad) -> None:
+    f: Callable[[int], int] = lambda x: x + 1
+    m: Functor = monad.pure(3)
+    assert m.map(f) == (m.fused() * f).run()
@@ -1,7 +1,12 @@
+import asyncio
+import gc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pytest  # type: ignore
-from typing import Any, Callable, List, TypeVar
+import threading
+from typing import Any, AsyncIterator, Callable, Iterator, List, TypeVar
 
-from monads import Functor, Applicative, Future
+from monads import Functor, Applicative, Future, Result, Ok, Err
+from monads.future import deadline
 
 T = TypeVar("T")
 S = TypeVar("S")
@@ -100,3 +105,427 @@ async def test_monad_associativity() -> None:
     assert await Future.pure(3).bind(f).bind(g) == await Future.pure(3).bind(
         lambda x: f(x).bind(g)
     )
+
+
+@pytest.mark.asyncio
+async def test_sequence() -> None:
+    assert [1, 2, 3] == await Future.sequence(
+        [Future.pure(1), Future.pure(2), Future.pure(3)]
+    )
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+    async def track(self, x: T) -> T:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return x
+
+
+@pytest.mark.asyncio
+async def test_gather() -> None:
+    counter = Counter()
+    gathered: Future[List[int]] = Future.gather(counter.track(x) for x in range(5))
+    assert [0, 1, 2, 3, 4] == await gathered
+    assert 5 == counter.peak
+
+
+@pytest.mark.asyncio
+async def test_gather_with_limit() -> None:
+    counter = Counter()
+    gathered: Future[List[int]] = Future.gather(
+        (counter.track(x) for x in range(5)), limit=2
+    )
+    assert [0, 1, 2, 3, 4] == await gathered
+    assert 2 == counter.peak
+
+
+def test_gather_rejects_invalid_limit() -> None:
+    with pytest.raises(ValueError):
+        Future.gather([], limit=0)
+
+
+@pytest.mark.asyncio
+async def test_long_map_chain() -> None:
+    m: Future[int] = Future.pure(0)
+    for _ in range(10**5):
+        m = m.map(lambda x: x + 1)
+    assert 10**5 == await m
+
+
+@pytest.mark.asyncio
+async def test_long_bind_chain() -> None:
+    m: Future[int] = Future.pure(0)
+    for _ in range(10**5):
+        m = m.bind(lambda x: Future.pure(x + 1))
+    assert 10**5 == await m
+
+
+@pytest.mark.asyncio
+async def test_long_sequence() -> None:
+    n = 10**6
+    assert list(range(n)) == await Future.sequence(Future.pure(x) for x in range(n))
+
+
+@pytest.mark.asyncio
+async def test_awaitable_includes_chained_steps() -> None:
+    m: Future[int] = Future.pure(1).map(lambda x: x + 1)
+    assert 2 == await m.awaitable
+
+
+@pytest.mark.asyncio
+async def test_apply_awaits_function_and_value_concurrently() -> None:
+    started = asyncio.Event()
+
+    async def wait() -> int:
+        await started.wait()
+        return 1
+
+    async def start() -> Callable[[int], int]:
+        started.set()
+        return lambda x: x + 1
+
+    m: Future[int] = Future(wait()).apply(start())
+    assert 2 == await asyncio.wait_for(m, 1)
+
+
+@pytest.mark.asyncio
+async def test_map2() -> None:
+    m: Future[int] = Future.map2(lambda x, y: x + y, Future.pure(1), Future.pure(2))
+    assert 3 == await m
+
+
+@pytest.mark.asyncio
+async def test_mapN_awaits_concurrently() -> None:
+    started = asyncio.Event()
+
+    async def wait() -> int:
+        await started.wait()
+        return 1
+
+    async def start() -> int:
+        started.set()
+        return 2
+
+    m: Future[int] = Future.mapN(
+        lambda x, y, z: x + y + z, wait(), start(), Future.pure(3)
+    )
+    assert 6 == await asyncio.wait_for(m, 1)
+
+
+@pytest.mark.asyncio
+async def test_mapN_cancels_others_on_error() -> None:
+    cancelled = asyncio.Event()
+
+    async def hang() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 1
+
+    async def fail() -> int:
+        raise ValueError("failed")
+
+    m: Future[int] = Future.mapN(lambda x, y: x + y, hang(), fail())
+    with pytest.raises(ValueError):
+        await m
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_with_timeout() -> None:
+    m: Future[Result[int, asyncio.TimeoutError]] = Future.pure(1).with_timeout(1)
+    assert Ok(1) == await m
+
+
+@pytest.mark.asyncio
+async def test_with_timeout_cancels_in_flight_awaitable() -> None:
+    cancelled = asyncio.Event()
+
+    async def hang() -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return 1
+
+    m = await Future(hang()).map(lambda x: x + 1).with_timeout(0.01)
+    assert isinstance(m, Err)
+    assert isinstance(m.err, asyncio.TimeoutError)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_deadline() -> None:
+    async def hang(x: int) -> int:
+        await asyncio.sleep(10)
+        return x
+
+    with deadline(0.01):
+        with pytest.raises(asyncio.TimeoutError):
+            await Future.pure(1).bind(hang)
+        assert isinstance(await Future.pure(1).bind(hang).with_timeout(None), Err)
+
+
+@pytest.mark.asyncio
+async def test_deadline_applies_to_sequence() -> None:
+    async def sleep(x: int) -> int:
+        await asyncio.sleep(x)
+        return x
+
+    with deadline(0.01):
+        with pytest.raises(asyncio.TimeoutError):
+            await Future.sequence([sleep(0), sleep(10)])
+
+
+@pytest.mark.asyncio
+async def test_nested_deadline_cannot_extend() -> None:
+    with deadline(0.01):
+        with deadline(10):
+            with pytest.raises(asyncio.TimeoutError):
+                await Future(asyncio.sleep(10))
+
+
+@pytest.mark.asyncio
+async def test_cancellation_reaches_in_flight_awaitable() -> None:
+    cancelled = asyncio.Event()
+
+    async def hang(x: int) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return x
+
+    task = asyncio.ensure_future(Future.pure(1).bind(hang).map(lambda x: x + 1))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_map_in_executor() -> None:
+    loop_thread = threading.get_ident()
+    with ThreadPoolExecutor(1) as executor:
+        m: Future[bool] = Future.pure(1).map_in_executor(
+            lambda _: threading.get_ident() != loop_thread, executor
+        )
+        assert await m
+
+
+@pytest.mark.asyncio
+async def test_map_in_default_executor() -> None:
+    m: Future[int] = Future.pure(-1).map_in_executor(abs).map(lambda x: x + 1)
+    assert 2 == await m
+
+
+@pytest.mark.asyncio
+async def test_map_in_process_pool() -> None:
+    with ProcessPoolExecutor(1) as executor:
+        m: Future[int] = Future.pure(-1).map_in_executor(abs, executor)
+        assert 1 == await m
+
+
+@pytest.mark.asyncio
+async def test_from_blocking() -> None:
+    m: Future[int] = Future.from_blocking(max, 1, 2)
+    assert 2 == await m
+
+
+@pytest.mark.asyncio
+async def test_shared_can_be_awaited_repeatedly() -> None:
+    calls: List[int] = []
+
+    async def count() -> int:
+        calls.append(1)
+        return 1
+
+    m: Future[int] = Future(count()).shared()
+    assert [1, 1] == [await m, await m]
+    assert [2, 2] == await Future.gather(
+        [m.map(lambda x: x + 1), m.map(lambda x: x + 1)]
+    )
+    assert 1 == len(calls)
+
+
+@pytest.mark.asyncio
+async def test_shared_keeps_error() -> None:
+    async def fail() -> int:
+        raise ValueError
+
+    m: Future[int] = Future(fail()).shared()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await m
+
+
+@pytest.mark.asyncio
+async def test_shared_is_not_cancelled_by_consumer() -> None:
+    async def slow() -> int:
+        await asyncio.sleep(0.05)
+        return 1
+
+    m: Future[int] = Future(slow()).shared()
+    assert isinstance(await m.with_timeout(0.001), Err)
+    assert 1 == await m
+
+
+@pytest.mark.asyncio
+async def test_traverse() -> None:
+    counter = Counter()
+    traversed: Future[List[int]] = Future.traverse(counter.track, range(5))
+    assert [0, 1, 2, 3, 4] == await traversed
+    assert 5 == counter.peak
+
+
+@pytest.mark.asyncio
+async def test_traverse_with_limit() -> None:
+    counter = Counter()
+    traversed: Future[List[int]] = Future.traverse(counter.track, range(5), limit=2)
+    assert [0, 1, 2, 3, 4] == await traversed
+    assert 2 == counter.peak
+
+
+@pytest.mark.asyncio
+async def test_traverse_async_iterable() -> None:
+    async def items() -> AsyncIterator[int]:
+        for x in range(5):
+            yield x
+
+    async def double(x: int) -> int:
+        return x * 2
+
+    traversed: Future[List[int]] = Future.traverse(double, items(), limit=2)
+    assert [0, 2, 4, 6, 8] == await traversed
+
+
+@pytest.mark.asyncio
+async def test_traverse_consumes_items_lazily() -> None:
+    consumed: List[int] = []
+
+    def items() -> Iterator[int]:
+        for x in range(10**6):
+            consumed.append(x)
+            yield x
+
+    stream = Future.stream(Future.pure, items(), limit=3)
+    assert 0 == await stream.__anext__()
+    assert len(consumed) <= 4
+
+
+@pytest.mark.asyncio
+async def test_stream_ordered() -> None:
+    async def sleep(x: int) -> int:
+        await asyncio.sleep(x / 100)
+        return x
+
+    stream = Future.stream(sleep, [3, 1, 2], limit=2)
+    assert [3, 1, 2] == [x async for x in stream]
+
+
+@pytest.mark.asyncio
+async def test_stream_unordered() -> None:
+    async def sleep(x: int) -> int:
+        await asyncio.sleep(x / 100)
+        return x
+
+    stream = Future.stream(sleep, [3, 1, 2], ordered=False)
+    assert [1, 2, 3] == [x async for x in stream]
+
+
+@pytest.mark.asyncio
+async def test_traverse_cancels_pending_on_error() -> None:
+    cancelled: List[int] = []
+
+    async def fail_or_hang(x: int) -> int:
+        if x == 0:
+            raise ValueError
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    with pytest.raises(ValueError):
+        await Future.traverse(fail_or_hang, range(3))
+    assert [1, 2] == sorted(cancelled)
+
+
+@pytest.mark.asyncio
+async def test_stream_cancels_pending_when_closed() -> None:
+    cancelled: List[int] = []
+
+    async def hang(x: int) -> int:
+        if x == 0:
+            return x
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    stream = Future.stream(hang, range(3))
+    assert 0 == await stream.__anext__()
+    await stream.aclose()
+    assert [1, 2] == sorted(cancelled)
+
+
+def test_traverse_rejects_invalid_limit() -> None:
+    with pytest.raises(ValueError):
+        Future.traverse(Future.pure, range(3), limit=0)
+
+
+@pytest.mark.asyncio
+async def test_shared_ignores_first_consumer_deadline() -> None:
+    async def slow() -> int:
+        await asyncio.sleep(0.05)
+        return 1
+
+    m: Future[int] = Future(slow()).shared()
+    with deadline(0.01):
+        with pytest.raises(asyncio.TimeoutError):
+            await m
+    assert 1 == await m
+
+
+@pytest.mark.asyncio
+async def test_traverse_unordered() -> None:
+    async def sleep(x: int) -> int:
+        await asyncio.sleep(x / 100)
+        return x
+
+    traversed: Future[List[int]] = Future.traverse(sleep, [3, 1, 2], ordered=False)
+    assert [1, 2, 3] == await traversed
+
+
+@pytest.mark.asyncio
+async def test_traverse_raises_first_error_in_order() -> None:
+    async def fail(x: int) -> int:
+        raise ValueError(x)
+
+    loop = asyncio.get_running_loop()
+    unretrieved: List[Any] = []
+    loop.set_exception_handler(lambda _, context: unretrieved.append(context))
+    try:
+        for _ in range(10):
+            with pytest.raises(ValueError) as error:
+                await Future.traverse(fail, range(5))
+            assert (0,) == error.value.args
+        gc.collect()
+        await asyncio.sleep(0)
+        assert [] == unretrieved
+    finally:
+        loop.set_exception_handler(None)
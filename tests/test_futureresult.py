@@ -0,0 +1,158 @@
+import asyncio
+import gc
+import pytest  # type: ignore
+from typing import Any, Callable, List
+
+from monads import Err, Future, FutureResult, Ok, Result
+
+
+@pytest.mark.asyncio
+async def test_types() -> None:
+    m: FutureResult[int, str] = FutureResult.pure(1)
+    await m
+    map: FutureResult[int, str] = FutureResult.pure(1).map(lambda x: x)
+    await map
+    bind: FutureResult[int, str] = FutureResult.pure(1).bind(
+        lambda x: FutureResult.pure(x)
+    )
+    await bind
+    sequence: FutureResult[List[int], str] = FutureResult.sequence(
+        [FutureResult.pure(1)]
+    )
+    await sequence
+
+
+@pytest.mark.asyncio
+async def test_map() -> None:
+    m: FutureResult[int, str] = FutureResult.pure(1).map(lambda x: x + 1)
+    assert Ok(2) == await m
+
+
+@pytest.mark.asyncio
+async def test_map_error() -> None:
+    m: FutureResult[int, str] = FutureResult.fromResult(Err("oops"))
+    assert Err("OOPS") == await m.mapError(str.upper)
+
+
+@pytest.mark.asyncio
+async def test_bind() -> None:
+    async def increment(x: int) -> Result[int, str]:
+        return Ok(x + 1)
+
+    one: FutureResult[int, str] = FutureResult.pure(1)
+    m: FutureResult[int, str] = one.bind(increment)
+    assert Ok(2) == await m
+
+
+@pytest.mark.asyncio
+async def test_bind_short_circuits_on_err() -> None:
+    calls: List[int] = []
+
+    def increment(x: int) -> FutureResult[int, str]:
+        calls.append(x)
+        return FutureResult.pure(x + 1)
+
+    m: FutureResult[int, str] = FutureResult.fromResult(Err("oops"))
+    for _ in range(10**5):
+        m = m.bind(increment)
+    assert Err("oops") == await m
+    assert [] == calls
+
+
+@pytest.mark.asyncio
+async def test_from_future() -> None:
+    m: FutureResult[int, str] = FutureResult.fromFuture(Future.pure(1))
+    assert Ok(1) == await m
+
+
+@pytest.mark.asyncio
+async def test_apply() -> None:
+    f: FutureResult[Callable[[int], int], str] = FutureResult.pure(lambda x: x + 1)
+    one: FutureResult[int, str] = FutureResult.pure(1)
+    m: FutureResult[int, str] = one.apply(f)
+    assert Ok(2) == await m
+
+
+@pytest.mark.asyncio
+async def test_sequence() -> None:
+    async def sleep(x: int) -> Result[int, str]:
+        await asyncio.sleep(x / 100)
+        return Ok(x)
+
+    m: FutureResult[List[int], str] = FutureResult.sequence(
+        [sleep(3), sleep(1), sleep(2)]
+    )
+    assert Ok([3, 1, 2]) == await m
+
+
+@pytest.mark.asyncio
+async def test_sequence_cancels_pending_on_err() -> None:
+    cancelled = asyncio.Event()
+
+    async def fail() -> Result[int, str]:
+        return Err("oops")
+
+    async def hang() -> Result[int, str]:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return Ok(1)
+
+    m: FutureResult[List[int], str] = FutureResult.sequence([hang(), fail()])
+    assert Err("oops") == await asyncio.wait_for(m, 1)
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_sequence_returns_first_err_in_order() -> None:
+    async def fail(error: str) -> Result[int, str]:
+        return Err(error)
+
+    for _ in range(10):
+        m: FutureResult[List[int], str] = FutureResult.sequence(
+            [fail("a"), fail("b"), fail("c")]
+        )
+        assert Err("a") == await m
+
+
+@pytest.mark.asyncio
+async def test_sequence_retrieves_sibling_errors() -> None:
+    async def fail() -> Result[int, str]:
+        return Err("oops")
+
+    async def raise_error() -> Result[int, str]:
+        raise ValueError
+
+    loop = asyncio.get_running_loop()
+    unretrieved: List[Any] = []
+    loop.set_exception_handler(lambda _, context: unretrieved.append(context))
+    try:
+        m: FutureResult[List[int], str] = FutureResult.sequence([fail(), raise_error()])
+        assert Err("oops") == await m
+        gc.collect()
+        await asyncio.sleep(0)
+        assert [] == unretrieved
+    finally:
+        loop.set_exception_handler(None)
+
+
+@pytest.mark.asyncio
+async def test_sequence_awaits_cancelled_actions() -> None:
+    finished = asyncio.Event()
+
+    async def fail() -> Result[int, str]:
+        return Err("oops")
+
+    async def hang() -> Result[int, str]:
+        try:
+            await asyncio.sleep(10)
+        finally:
+            finished.set()
+        return Ok(1)
+
+    m: FutureResult[List[int], str] = FutureResult.sequence([hang(), fail()])
+    assert Err("oops") == await m
+    assert finished.is_set()
@@ -0,0 +1,74 @@
+import tracemalloc
+from itertools import count, islice
+from typing import Callable, Iterator, List as _List
+
+from monads.lazylist import LazyList
+from monads.list import List
+
+
+def test_types() -> None:
+    m: LazyList[int] = LazyList.pure(1)
+    map: LazyList[int] = m.map(lambda x: x)
+    map_operator: LazyList[int] = m * (lambda x: x)
+    bind: LazyList[int] = m.bind(lambda x: LazyList.pure(x))
+    bind_operator: LazyList[int] = m >> (lambda x: LazyList.pure(x))
+    apply: LazyList[int] = m.apply(LazyList.pure(lambda x: x))
+    apply_operator: LazyList[int] = LazyList.pure(lambda x: x) & m
+    sequence: LazyList[_List[int]] = LazyList.sequence([m])
+
+
+def test_matches_list() -> None:
+    xs: List[int] = List([1, 2, 3])
+    f: Callable[[int], List[int]] = lambda x: List([x, x * 10])
+    g: Callable[[int], LazyList[int]] = lambda x: LazyList.fromList(f(x))
+    add: List[Callable[[int], int]] = List([lambda x: x + 1, lambda x: x + 2])
+    lazy: LazyList[int] = LazyList.fromList(xs)
+    assert xs.map(str) == lazy.map(str).toList()
+    assert xs.bind(f) == lazy.bind(g).toList()
+    assert xs.apply(add) == lazy.apply(LazyList.fromList(add)).toList()
+    assert List.sequence([xs, xs]) == LazyList.sequence([lazy, lazy]).toList()
+
+
+def test_apply_over_one_shot_source() -> None:
+    functions: List[Callable[[int], int]] = List([lambda x: x + 1, lambda x: x * 10])
+    lazy: LazyList[int] = LazyList(x for x in [1, 2])
+    assert List([2, 3, 10, 20]) == lazy.apply(LazyList.fromList(functions)).toList()
+
+
+def test_apply_single_function_does_not_keep_items() -> None:
+    m: LazyList[int] = LazyList(count()).apply(LazyList.pure(lambda x: x + 1))
+    items = iter(m)
+    tracemalloc.start()
+    try:
+        for _ in islice(items, 10**5):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < 10**5
+
+
+def test_evaluates_only_when_consumed() -> None:
+    consumed: _List[int] = []
+
+    def track(x: int) -> int:
+        consumed.append(x)
+        return x
+
+    m: LazyList[int] = LazyList(count()).map(track)
+    assert [] == consumed
+    assert List([0, 1, 2]) == m.take(3).toList()
+    assert [0, 1, 2] == consumed
+
+
+def test_infinite_source() -> None:
+    m: LazyList[int] = (
+        LazyList(count()).filter(lambda x: x % 2 == 0).map(lambda x: x * 10).drop(1)
+    )
+    assert List([20, 40, 60]) == m.take(3).toList()
+
+
+def test_can_be_consumed_repeatedly() -> None:
+    m: LazyList[int] = LazyList([1, 2, 3]).map(lambda x: x + 1)
+    assert [2, 3, 4] == list(m)
+    assert [2, 3, 4] == list(m)
@@ -0,0 +1,46 @@
+from typing import List as _List
+
+from monads.list import List
+
+
+def test_sequence_combines_every_choice() -> None:
+    expected: List[_List[int]] = List([[1, 3], [1, 4], [2, 3], [2, 4]])
+    assert expected == List.sequence([List([1, 2]), List([3, 4])])
+
+
+def test_sequence_with_empty_list() -> None:
+    assert List([]) == List.sequence([List([1, 2]), List([])])
+
+
+def test_bind_concatenates_results_in_order() -> None:
+    m: List[int] = List([1, 2, 3])
+    assert List([1, 1, 2, 2, 3, 3]) == m.bind(lambda x: List([x, x]))
+
+
+def test_bind_long_list() -> None:
+    n = 10**5
+    m: List[int] = List(list(range(n)))
+    assert List([x for x in range(n) for _ in range(2)]) == m.bind(
+        lambda x: List([x, x])
+    )
+
+
+def test_mconcat_long_list() -> None:
+    n = 10**5
+    assert List(list(range(n))) == List.mconcat(List([x]) for x in range(n))
+
+
+def test_fused_maps_in_a_single_pass() -> None:
+    calls: _List[str] = []
+
+    def f(x: int) -> int:
+        calls.append(f"f{x}")
+        return x
+
+    def g(x: int) -> int:
+        calls.append(f"g{x}")
+        return x
+
+    fused: List[int] = List([1, 2]).fused().map(f).map(g).run()
+    assert List([1, 2]) == fused
+    assert ["f1", "g1", "f2", "g2"] == calls
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import pytest  # type: ignore
 from typing import Callable, List
 
@@ -126,3 +128,39 @@ def test_just_to_optional() -> None:
 
 def test_nothing_to_optional() -> None:
     assert None == Nothing().toOptional()
+
+
+def test_sequence_just() -> None:
+    assert Just([1, 2, 3]) == Maybe.sequence([Just(1), Just(2), Just(3)])
+
+
+def test_sequence_nothing() -> None:
+    assert Nothing() == Maybe.sequence([Just(1), Nothing(), Just(3)])
+
+
+def test_sequence_stops_at_first_nothing() -> None:
+    consumed: List[int] = []
+
+    def maybes():
+        for x in range(10):
+            consumed.append(x)
+            yield Nothing() if x == 2 else Just(x)
+
+    assert Nothing() == Maybe.sequence(maybes())
+    assert [0, 1, 2] == consumed
+
+
+def test_nothing_has_no_dict() -> None:
+    assert not hasattr(Nothing(), "__dict__")
+
+
+def test_nothing_is_a_singleton() -> None:
+    assert Nothing() is Nothing()
+    assert Nothing() is Just(1).bind(lambda _: Nothing())
+    assert Nothing() is maybe(None)
+    assert Nothing() is Maybe.fromList([])
+
+
+def test_copied_nothing_is_the_singleton() -> None:
+    assert Nothing() is copy.copy(Nothing())
+    assert Nothing() is pickle.loads(pickle.dumps(Nothing()))
@@ -47,3 +47,12 @@ def test_sequence(monad) -> None:
     assert monad.pure([1, 2, 3]) == monad.sequence(
         [monad.pure(1), monad.pure(2), monad.pure(3)]
     )
+
+
+def test_sequence_long(monad) -> None:
+    n = 10**5
+    assert monad.pure(list(range(n))) == monad.sequence(monad.pure(x) for x in range(n))
+
+
+def test_instances_have_no_dict(monad) -> None:
+    assert not hasattr(monad.pure(1), "__dict__")
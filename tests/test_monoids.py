@@ -55,3 +55,26 @@ def test_mconcat(constructor: Constructor) -> None:
     c: Monoid = construct(constructor, 3)
     expected: Monoid = a.mappend(b).mappend(c)
     assert expected == cls.mconcat([a, b, c])
+
+
+def test_instances_have_no_dict(constructor: Constructor) -> None:
+    assert not hasattr(construct(constructor, 1), "__dict__")
+
+
+@pytest.mark.parametrize("cls", [First, Last, String, Addition, Multiplication])
+def test_immutable_identity_is_interned(cls: Type) -> None:
+    assert cls.mzero() is cls.mzero()
+
+
+@pytest.mark.parametrize("cls", [First, Last, String, Addition, Multiplication])
+def test_interned_identity_rejects_assignment(cls: Type) -> None:
+    zero: Monoid = cls.mzero()
+    with pytest.raises(AttributeError):
+        zero.value = 5
+    assert zero == cls.mconcat([])
+
+
+def test_list_identity_is_not_shared() -> None:
+    zero: List = List.mzero()
+    zero.value.append(1)
+    assert List([]) == List.mzero()
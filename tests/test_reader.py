@@ -1,8 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+import gc
 import inspect
+from itertools import islice
+import pickle
 import pytest  # type: ignore
-from typing import Any, Callable, List, TypeVar
+from typing import Any, Callable, Iterator, List, TypeVar
 
 from monads import Functor, Applicative, Reader
+from monads.reader import MemoizedReader
 
 T = TypeVar("T")
 S = TypeVar("S")
@@ -91,3 +96,262 @@ def test_monad_associativity() -> None:
 
 def test_pure_annotation_includes_concrete_type() -> None:
     assert int == inspect.signature(Reader.pure(5)).return_annotation
+
+
+def test_sequence() -> None:
+    m: Reader[int, List[int]] = Reader.sequence(
+        [Reader(lambda x: x), Reader(lambda x: x + 1), Reader(lambda x: x + 2)]
+    )
+    assert [1, 2, 3] == m(1)
+    assert [2, 3, 4] == m(2)
+
+
+def test_long_map_chain() -> None:
+    m: Reader[int, int] = Reader(lambda x: x)
+    for _ in range(10**5):
+        m = m.map(lambda x: x + 1)
+    assert 10**5 == m(0)
+    assert 10**5 + 1 == m(1)
+
+
+def test_long_bind_chain() -> None:
+    m: Reader[int, int] = Reader(lambda x: x)
+    for _ in range(10**5):
+        m = m.bind(lambda x: Reader(lambda y: x + y))
+    assert 10**5 + 1 == m(1)
+
+
+def test_long_apply_chain() -> None:
+    m: Reader[int, int] = Reader(lambda x: x)
+    for _ in range(10**5):
+        m = m.apply(Reader(lambda y: lambda x: x + y))
+    assert 2 * 10**5 == m(2) - 2
+
+
+def test_branching_compositions_are_independent() -> None:
+    m: Reader[int, int] = Reader(lambda x: x * 2)
+    incremented: Reader[int, int] = m.map(lambda x: x + 1)
+    decremented: Reader[int, int] = m.map(lambda x: x - 1)
+    assert 11 == incremented(5)
+    assert 9 == decremented(5)
+    assert 10 == m(5)
+
+
+def test_function_runs_the_composition() -> None:
+    m: Reader[int, int] = Reader(lambda x: x * 2).map(lambda x: x + 1)
+    assert 11 == m.function(5)
+
+
+def test_compose_subclass() -> None:
+    class Doubled(Reader[int, int]):
+        def __call__(self, environment: int) -> int:
+            return 2 * super().__call__(environment)
+
+    m: Reader[int, int] = Doubled(lambda x: x).map(lambda x: x + 1)
+    assert 11 == m(5)
+
+
+def test_mixed_composition() -> None:
+    m: Reader[int, int] = (
+        Reader(lambda x: x)
+        .map(lambda x: x + 1)
+        .map(lambda x: x * 2)
+        .bind(lambda x: Reader(lambda y: x + y))
+        .map(lambda x: x - 1)
+        .apply(Reader(lambda y: lambda x: x * y))
+    )
+    assert 30 == m(3)
+
+
+def test_memoized_caches_by_environment() -> None:
+    calls: List[int] = []
+
+    def double(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    m: MemoizedReader[int, int] = Reader(double).map(lambda x: x + 1).memoized()
+    assert [11, 11, 13, 11] == [m(5), m(5), m(6), m(5)]
+    assert [5, 6] == calls
+    assert (2, 2, 128, 2) == m.cache_info()
+
+
+def test_memoized_evicts_least_recently_used() -> None:
+    calls: List[int] = []
+
+    def identity(x: int) -> int:
+        calls.append(x)
+        return x
+
+    m: MemoizedReader[int, int] = Reader(identity).memoized(maxsize=2)
+    for x in [1, 2, 1, 3, 2, 1]:
+        m(x)
+    assert [1, 2, 3, 2, 1] == calls
+    assert 2 == m.cache_info().currsize
+
+
+def test_memoized_rejects_negative_maxsize() -> None:
+    with pytest.raises(ValueError):
+        Reader(lambda x: x).memoized(-1)
+
+
+def test_memoized_weak_does_not_keep_environment_alive() -> None:
+    class Config:
+        def __init__(self, value: int) -> None:
+            self.value = value
+
+    m: MemoizedReader[Config, int] = Reader(lambda config: config.value * 2).memoized(
+        weak=True
+    )
+    config = Config(5)
+    assert 10 == m(config)
+    assert 10 == m(config)
+    assert (1, 1, None, 1) == m.cache_info()
+    del config
+    gc.collect()
+    assert 0 == m.cache_info().currsize
+
+
+def test_memoized_composes() -> None:
+    m: Reader[int, int] = Reader(lambda x: x * 2).memoized().map(lambda x: x + 1)
+    assert 11 == m(5)
+    assert 11 == m(5)
+
+
+def test_memoized_cache_clear() -> None:
+    m: MemoizedReader[int, int] = Reader(lambda x: x * 2).memoized()
+    m(5)
+    m.cache_clear()
+    assert (0, 0, 128, 0) == m.cache_info()
+
+
+def test_local() -> None:
+    double: Reader[int, int] = Reader(lambda x: x * 2)
+    m: Reader[str, int] = double.local(len)
+    assert 6 == m("abc")
+
+
+def test_asks() -> None:
+    m: Reader[dict, int] = Reader.asks(lambda config: config["port"])
+    assert 80 == m({"port": 80})
+
+
+def test_ask() -> None:
+    m: Reader[int, int] = Reader.ask()
+    assert 5 == m(5)
+
+
+def test_shared_runs_once_per_environment() -> None:
+    calls: List[dict] = []
+
+    def parse(config: dict) -> int:
+        calls.append(config)
+        return int(config["port"])
+
+    port: Reader[dict, int] = Reader(parse).shared()
+    m: Reader[dict, int] = port.map(lambda x: x + 1).bind(
+        lambda x: port.map(lambda y: x + y)
+    )
+    first, second = {"port": "80"}, {"port": "80"}
+    assert 161 == m(first)
+    assert [first] == calls
+    assert 161 == m(second)
+    assert [first, second] == calls
+
+
+def test_shared_runs_again_on_each_run() -> None:
+    calls: List[dict] = []
+
+    def parse(config: dict) -> int:
+        calls.append(config)
+        return int(config["port"])
+
+    port: Reader[dict, int] = Reader(parse).shared()
+    m: Reader[dict, List[int]] = Reader.sequence([port, port.map(lambda x: x + 1)])
+    config = {"port": "80"}
+    assert [80, 81] == m(config)
+    config["port"] = "81"
+    assert [81, 82] == m(config)
+    assert 2 == len(calls)
+    assert 81 == port(config)
+
+
+def test_shared_outside_composition_runs_each_call() -> None:
+    calls: List[dict] = []
+
+    def parse(config: dict) -> int:
+        calls.append(config)
+        return int(config["port"])
+
+    port: Reader[dict, int] = Reader(parse).shared()
+    m: Reader[dict, int] = Reader(lambda config: port(config) + port(config))
+    assert not m._shared
+    assert 160 == m({"port": "80"})
+    assert 2 == len(calls)
+
+
+def test_run_many() -> None:
+    m: Reader[int, int] = Reader(lambda x: x * 2).map(lambda x: x + 1)
+    assert [1, 3, 5] == list(m.run_many(range(3)))
+
+
+def test_run_many_in_executor() -> None:
+    m: Reader[int, int] = Reader(lambda x: x * 2).map(lambda x: x + 1)
+    with ThreadPoolExecutor(4) as executor:
+        assert [2 * x + 1 for x in range(100)] == list(m.run_many(range(100), executor))
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+def increment(x: int) -> int:
+    return x + 1
+
+
+def test_composition_can_be_pickled_after_running() -> None:
+    m: Reader[int, int] = Reader(double).map(increment).map(double)
+    assert [2, 6] == list(m.run_many([0, 1]))
+    assert 22 == pickle.loads(pickle.dumps(m))(5)
+
+
+def test_apply_runs_its_argument_first() -> None:
+    calls: List[str] = []
+
+    def track(name: str, value: Any) -> Reader[int, Any]:
+        def run(x: int) -> Any:
+            calls.append(name)
+            return value
+
+        return Reader(run)
+
+    m: Reader[int, int] = (
+        track("source", 1)
+        .apply(track("first", lambda x: x + 1))
+        .map(lambda x: x * 2)
+        .apply(track("second", lambda x: x + 3))
+    )
+    assert 7 == m(0)
+    assert ["second", "first", "source"] == calls
+
+
+def test_run_many_consumes_environments_lazily() -> None:
+    consumed: List[int] = []
+
+    def environments() -> Iterator[int]:
+        for x in range(10**6):
+            consumed.append(x)
+            yield x
+
+    m: Reader[int, int] = Reader(lambda x: x * 2)
+    with ThreadPoolExecutor(2) as executor:
+        results = m.run_many(environments(), executor, chunksize=10, window=3)
+        assert [0, 2, 4] == list(islice(results, 3))
+        assert len(consumed) <= 40
+
+
+def test_run_many_in_executor_in_chunks() -> None:
+    m: Reader[int, int] = Reader(double).map(increment)
+    with ThreadPoolExecutor(2) as executor:
+        results = m.run_many(range(25), executor, chunksize=4)
+        assert [2 * x + 1 for x in range(25)] == list(results)
@@ -0,0 +1,141 @@
+import asyncio
+import pytest  # type: ignore
+from typing import Awaitable, Callable, Dict, List
+
+from monads import Future, Reader, ReaderFuture
+
+
+async def fetch(config: Dict[str, int]) -> int:
+    return config["port"]
+
+
+@pytest.mark.asyncio
+async def test_types() -> None:
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture.pure(1)
+    await m({})
+    map: ReaderFuture[Dict[str, int], int] = ReaderFuture.pure(1).map(lambda x: x)
+    await map({})
+    sequence: ReaderFuture[Dict[str, int], List[int]] = ReaderFuture.sequence(
+        [ReaderFuture.pure(1)]
+    )
+    await sequence({})
+
+
+@pytest.mark.asyncio
+async def test_call_returns_future() -> None:
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(fetch)
+    future = m({"port": 80})
+    assert isinstance(future, Future)
+    assert 80 == await future
+
+
+@pytest.mark.asyncio
+async def test_map() -> None:
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(fetch).map(lambda x: x + 1)
+    assert 81 == await m({"port": 80})
+
+
+@pytest.mark.asyncio
+async def test_map_coroutine_function() -> None:
+    async def increment(x: int) -> int:
+        return x + 1
+
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(fetch).map(increment)
+    assert 81 == await m({"port": 80})
+
+
+@pytest.mark.asyncio
+async def test_bind() -> None:
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(fetch).bind(
+        lambda x: ReaderFuture(fetch).map(lambda y: x + y)
+    )
+    assert 160 == await m({"port": 80})
+
+
+@pytest.mark.asyncio
+async def test_bind_coroutine_function() -> None:
+    async def add_port(x: int) -> ReaderFuture[Dict[str, int], int]:
+        return ReaderFuture(fetch).map(lambda y: x + y)
+
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(fetch).bind(add_port)
+    assert 160 == await m({"port": 80})
+
+
+@pytest.mark.asyncio
+async def test_apply_runs_concurrently() -> None:
+    started = asyncio.Event()
+
+    async def wait(_: Dict[str, int]) -> int:
+        await started.wait()
+        return 1
+
+    async def start(_: Dict[str, int]) -> Callable[[int], int]:
+        started.set()
+        return lambda x: x + 1
+
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(wait).apply(ReaderFuture(start))
+    assert 2 == await asyncio.wait_for(m({}), 1)
+
+
+@pytest.mark.asyncio
+async def test_sequence_runs_concurrently() -> None:
+    started = asyncio.Event()
+
+    async def wait(_: Dict[str, int]) -> int:
+        await started.wait()
+        return 1
+
+    async def start(_: Dict[str, int]) -> int:
+        started.set()
+        return 2
+
+    m: ReaderFuture[Dict[str, int], List[int]] = ReaderFuture.sequence(
+        [ReaderFuture(wait), ReaderFuture(start)]
+    )
+    assert [1, 2] == await asyncio.wait_for(m({}), 1)
+
+
+@pytest.mark.asyncio
+async def test_lift() -> None:
+    port: Reader[Dict[str, int], int] = Reader(lambda config: config["port"])
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture.lift(port)
+    assert 80 == await m({"port": 80})
+
+
+@pytest.mark.asyncio
+async def test_lift_reader_returning_future() -> None:
+    port: Reader[Dict[str, int], Awaitable[int]] = Reader(
+        lambda config: Future.pure(config["port"])
+    )
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture.lift(port)
+    assert 80 == await m({"port": 80})
+
+
+@pytest.mark.asyncio
+async def test_long_map_chain() -> None:
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(fetch)
+    for _ in range(10**4):
+        m = m.map(lambda x: x + 1)
+    assert 80 + 10**4 == await m({"port": 80})
+
+
+@pytest.mark.asyncio
+async def test_long_apply_chain() -> None:
+    increment: ReaderFuture[Dict[str, int], Callable[[int], int]] = ReaderFuture.pure(
+        lambda x: x + 1
+    )
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(fetch)
+    for _ in range(5000):
+        m = m.apply(increment)
+    assert 80 + 5000 == await m({"port": 80})
+
+
+@pytest.mark.asyncio
+async def test_long_bind_chain() -> None:
+    async def increment(x: int) -> int:
+        return x + 1
+
+    m: ReaderFuture[Dict[str, int], int] = ReaderFuture(fetch)
+    for _ in range(10**4):
+        m = m.bind(lambda x: ReaderFuture.pure(x).map(increment))
+    assert 80 + 10**4 == await m({"port": 80})
@@ -181,3 +181,46 @@ def test_ok_to_optional() -> None:
 
 def test_err_to_optional() -> None:
     assert None == Err("error").toOptional()
+
+
+def test_sequence_ok() -> None:
+    assert Ok([1, 2, 3]) == Result.sequence([Ok(1), Ok(2), Ok(3)])
+
+
+def test_sequence_returns_first_err() -> None:
+    assert Err("first") == Result.sequence([Ok(1), Err("first"), Err("second")])
+
+
+def test_sequence_stops_at_first_err() -> None:
+    consumed: List[int] = []
+
+    def results():
+        for x in range(10):
+            consumed.append(x)
+            yield Err(x) if x == 2 else Ok(x)
+
+    assert Err(2) == Result.sequence(results())
+    assert [0, 1, 2] == consumed
+
+
+def test_err_has_no_dict() -> None:
+    assert not hasattr(Err("oops"), "__dict__")
+
+
+def test_err_passes_through_unchanged() -> None:
+    err: Result[int, str] = Err("oops")
+    assert err is err.bind(lambda x: Ok(x + 1))
+    assert err is err.map(lambda x: x + 1)
+    assert err is err.apply(Ok(lambda x: x + 1))
+    assert err is Result.sequence([Ok(1), err])
+
+
+def test_err_function_passes_through_apply_unchanged() -> None:
+    m: Result[int, str] = Ok(1)
+    f: Result[Callable[[int], int], str] = Err("oops")
+    assert f is m.apply(f)
+
+
+def test_map_error_ok_is_unchanged() -> None:
+    m: Result[int, str] = Ok(123)
+    assert m is m.mapError(len)